@@ -0,0 +1,93 @@
+"""
+Benchmark of buffered against direct answer submissions.
+
+Run with `python -m pickemApi.benchmarks.answer_buffer [database_url]`,
+by default against a temporary SQLite file.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from pickemApi.models.enums import AnswerConflictMode
+from pickemApi.models.model import Base, Event, QuestionType
+from pickemApi.services.answer_buffer import AnswerWriteBuffer
+from pickemApi.services.user_answer_service import answer_upsert_statement
+
+
+SUBMISSIONS = 2000
+CONCURRENCY = 50
+
+
+async def submit_direct(session_maker, row):
+    async with session_maker() as db:
+        answer = (
+            await db.scalars(
+                answer_upsert_statement(db, [row], AnswerConflictMode.REJECT)
+            )
+        ).one_or_none()
+        await db.commit()
+        return answer
+
+
+async def run(session_maker, event_id, submit):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            row = {"user_id": uuid.uuid4(), "event_id": event_id, "answer": "yes"}
+            return await submit(row)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(SUBMISSIONS)))
+    return SUBMISSIONS / (time.perf_counter() - start)
+
+
+async def main(database_url: str):
+    connect_args = {"timeout": 60} if database_url.startswith("sqlite") else {}
+    engine = create_async_engine(database_url, connect_args=connect_args)
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_maker() as db:
+        event = Event(
+            tournament_id=uuid.uuid4(),
+            question_type=QuestionType.YES_NO,
+            question_text="Is it sunny?",
+            points_value=10,
+        )
+        db.add(event)
+        await db.commit()
+
+    direct = await run(
+        session_maker, event.id, lambda row: submit_direct(session_maker, row)
+    )
+    print(f"direct:   {direct:>8.0f} answers/s")
+
+    for flush_ms, max_rows in ((5, 100), (10, 500)):
+        buffer = AnswerWriteBuffer(session_maker, flush_ms / 1000, max_rows)
+        buffered = await run(
+            session_maker,
+            event.id,
+            lambda row: buffer.submit(row, AnswerConflictMode.REJECT),
+        )
+        await buffer.close()
+        print(f"buffered: {buffered:>8.0f} answers/s ({flush_ms} ms / {max_rows} rows)")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        url = sys.argv[1]
+    else:
+        url = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    asyncio.run(main(url))
@@ -0,0 +1,129 @@
+"""
+Benchmark of authenticated request latency against answer-history size.
+
+Compares the slim auth user load with a full load that also fetches the
+user's answers, as the previous selectin relationships did, and with users
+served from the auth user cache. Run with
+`python -m pickemApi.benchmarks.auth_latency`.
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}",
+)
+
+from fastapi import Depends  # noqa: E402
+from fastapi_users.db import SQLAlchemyUserDatabase  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import delete, select  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from pickemApi.core.database import (  # noqa: E402
+    AsyncSession,
+    async_session_maker,
+    engine,
+    get_write_db,
+    get_user_db,
+)
+from pickemApi.core.security import get_jwt_strategy  # noqa: E402
+from pickemApi.core.user_cache import user_cache  # noqa: E402
+from pickemApi.main import app  # noqa: E402
+from pickemApi.models.model import Base, Event, QuestionType, User, UserAnswer  # noqa: E402
+
+
+HISTORY_SIZES = (0, 1_000, 10_000)
+REQUESTS = 200
+
+
+class FullUserDatabase(SQLAlchemyUserDatabase):
+    async def get(self, id):
+        statement = (
+            select(User).where(User.id == id).options(selectinload(User.answers))
+        )
+        return await self._get_user(statement)
+
+
+async def get_full_user_db(session: AsyncSession = Depends(get_write_db)):
+    yield FullUserDatabase(session, User)
+
+
+async def set_history(user: User, size: int):
+    async with async_session_maker() as db:
+        await db.execute(delete(UserAnswer))
+        await db.execute(delete(Event))
+        events = [
+            Event(
+                id=uuid.uuid4(),
+                tournament_id=uuid.uuid4(),
+                question_type=QuestionType.YES_NO,
+                question_text="Is it sunny?",
+                points_value=1,
+            )
+            for _ in range(size)
+        ]
+        db.add_all(events)
+        db.add_all(
+            UserAnswer(user_id=user.id, event_id=event.id, answer="yes")
+            for event in events
+        )
+        await db.commit()
+
+
+async def measure(client: AsyncClient) -> tuple[float, float]:
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        response = await client.get("/authenticated-route")
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+async def main():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session_maker() as db:
+        user = User(email="bench@example.com", hashed_password="x", username="bench")
+        db.add(user)
+        await db.commit()
+
+    token = await get_jwt_strategy().write_token(user)
+    cache_entries = user_cache.max_entries
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        print(f"{'answers':>8} {'loader':>6} {'p50 ms':>8} {'p99 ms':>8}")
+        for size in HISTORY_SIZES:
+            await set_history(user, size)
+            for name, override, cache_size in (
+                ("full", get_full_user_db, 0),
+                ("slim", None, 0),
+                ("cached", None, cache_entries),
+            ):
+                if override:
+                    app.dependency_overrides[get_user_db] = override
+                else:
+                    app.dependency_overrides.clear()
+                user_cache.clear()
+                user_cache.max_entries = cache_size
+                p50, p99 = await measure(client)
+                print(f"{size:>8} {name:>6} {p50:>8.2f} {p99:>8.2f}")
+        print(user_cache.stats())
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
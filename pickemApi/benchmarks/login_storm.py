@@ -0,0 +1,107 @@
+"""
+Benchmark of unrelated request latency during a login storm.
+
+Logs in many users at once while another client keeps reading the global
+standings: with Argon2 on the event loop, in the password pool, and in the
+pool with a pending limit below the storm size, so excess logins get 503.
+Run with `python -m pickemApi.benchmarks.login_storm`.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}",
+)
+
+from fastapi_users.password import PasswordHelper  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from pickemApi.core.database import async_session_maker, engine  # noqa: E402
+from pickemApi.core.password import password_pool  # noqa: E402
+from pickemApi.main import app  # noqa: E402
+from pickemApi.models.model import Base, User  # noqa: E402
+
+
+USERS = 100
+LOGINS = 40
+PASSWORD = "strongpassword"
+
+
+async def run_inline(function, *args):
+    return function(*args)
+
+
+async def storm(client: AsyncClient) -> tuple[list[float], dict]:
+    statuses = {}
+    done = asyncio.Event()
+
+    async def login(i: int):
+        response = await client.post(
+            "/auth/jwt/login",
+            data={"username": f"user{i % USERS}@example.com", "password": PASSWORD},
+        )
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    async def read_standings():
+        latencies = []
+        while not done.is_set():
+            start = time.perf_counter()
+            response = await client.get("/standings")
+            latencies.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+            await asyncio.sleep(0.005)
+        return latencies
+
+    reader = asyncio.create_task(read_standings())
+    await asyncio.gather(*(login(i) for i in range(LOGINS)))
+    done.set()
+    return sorted(await reader), statuses
+
+
+async def main():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    hashed_password = PasswordHelper().hash(PASSWORD)
+    async with async_session_maker() as db:
+        db.add_all(
+            User(
+                email=f"user{i}@example.com",
+                hashed_password=hashed_password,
+                username=f"user{i}",
+            )
+            for i in range(USERS)
+        )
+        await db.commit()
+
+    pool_run, max_pending = password_pool.run, password_pool.max_pending
+    scenarios = (
+        ("event loop", run_inline, max_pending),
+        ("pool", pool_run, max_pending),
+        ("pool, 8 pending", pool_run, 8),
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{LOGINS} concurrent logins, standings read every 5 ms")
+        for name, run, pending_limit in scenarios:
+            password_pool.run = run
+            password_pool.max_pending = pending_limit
+            start = time.perf_counter()
+            latencies, statuses = await storm(client)
+            elapsed = time.perf_counter() - start
+            p50 = latencies[len(latencies) // 2]
+            p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+            print(
+                f"{name:<16} standings p50 {p50:>7.1f} ms, p99 {p99:>7.1f} ms, "
+                f"{len(latencies)} reads, storm {elapsed:.1f} s, logins {statuses}"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
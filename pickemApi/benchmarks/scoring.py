@@ -0,0 +1,244 @@
+"""
+Benchmark of the columnar scorer against the per-answer `check_answer` loop.
+
+The first table times the scoring pass alone. The second times scoring a
+whole tournament in a temporary SQLite database, loading answers and
+writing points back, with `rescore_events` against the row by row ORM
+loop it replaced.
+
+Run with `python -m pickemApi.benchmarks.scoring`.
+"""
+
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+import uuid
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.future import select
+
+from pickemApi.models.enums import QuestionType
+from pickemApi.models.model import Base, Event, User, UserAnswer
+from pickemApi.services.scoring import rescore_events
+from pickemApi.validators.answer_check import AnswerCodes, check_answer, score_answers
+
+EVENT_COUNT = 40
+USER_COUNT = 10_000
+SIZES = (100_000, 1_000_000)
+DATABASE_SIZES = (10_000, 100_000)
+
+OPTIONS = {
+    QuestionType.YES_NO: ["yes", "no", "Yes", "NO"],
+    QuestionType.SINGLE_CHOICE: [f"Team {i}" for i in range(16)],
+    QuestionType.MULTIPLE_CHOICE: [
+        ["Team 1", "Team 2"],
+        ["Team 2", "Team 1"],
+        ["Team 3", "Team 1"],
+    ],
+}
+
+
+def make_tournament(size: int, rng: random.Random):
+    events = []
+    for _ in range(EVENT_COUNT):
+        question_type = rng.choice(list(QuestionType))
+        events.append(
+            (question_type, rng.choice(OPTIONS[question_type]), rng.randint(1, 30))
+        )
+    rows = []
+    for _ in range(size):
+        event_i = rng.randrange(EVENT_COUNT)
+        rows.append(
+            (
+                event_i,
+                rng.randrange(USER_COUNT),
+                rng.choice(OPTIONS[events[event_i][0]]),
+            )
+        )
+    return events, rows
+
+
+def run_loop(events, rows):
+    user_points = {}
+    for event_i, user_i, answer in rows:
+        question_type, solution, points_value = events[event_i]
+        if check_answer(answer, solution, question_type):
+            user_points[user_i] = user_points.get(user_i, 0) + points_value
+    return user_points
+
+
+def run_encode(events, rows):
+    codes = AnswerCodes()
+    return (
+        np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)),
+        np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows)),
+        np.fromiter(
+            (codes.encode(answer, events[i][0]) for i, _, answer in rows),
+            dtype=np.int64,
+            count=len(rows),
+        ),
+        np.array([codes.encode(solution, qt) for qt, solution, _ in events]),
+        np.array([points_value for _, _, points_value in events]),
+    )
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+async def finalize_row_by_row(db: AsyncSession, events: list[Event]):
+    """Score like finalize did before the columnar scorer, one ORM row at a time."""
+    answers = (
+        await db.scalars(
+            select(UserAnswer).where(
+                UserAnswer.event_id.in_([event.id for event in events])
+            )
+        )
+    ).all()
+    user_points = {}
+    for answer in answers:
+        event = next(e for e in events if e.id == answer.event_id)
+        if check_answer(answer.answer, event.solution, event.question_type):
+            user_points[answer.user_id] = (
+                user_points.get(answer.user_id, 0) + event.points_value
+            )
+            answer.points = event.points_value
+    for user_id, points in user_points.items():
+        user = await db.get(User, user_id)
+        user.points += points
+    await db.commit()
+
+
+async def finalize_columnar(db: AsyncSession, events: list[Event]):
+    await rescore_events(events, db)
+    await db.commit()
+
+
+def text_uuid() -> uuid.UUID:
+    """Return a random UUID whose hex form SQLite cannot read as a number.
+
+    UUID columns have NUMERIC affinity in SQLite, so the rare hex strings
+    made of digits and at most one "e" would be stored as numbers, which
+    the many ids of this benchmark run into.
+    """
+    while True:
+        value = uuid.uuid4()
+        if any(digit in "abcdf" for digit in value.hex):
+            return value
+
+
+async def time_database(size: int, rng: random.Random, finalize) -> float:
+    """Load a tournament into a fresh SQLite file and time `finalize` on it."""
+    events, rows = make_tournament(size, rng)
+    rows = list({(event_i, user_i): answer for event_i, user_i, answer in rows}.items())
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(directory, 'scoring.db')}"
+        )
+        session_maker = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        tournament_id = text_uuid()
+        user_ids = [text_uuid() for _ in range(USER_COUNT)]
+        event_rows = [
+            Event(
+                id=text_uuid(),
+                tournament_id=tournament_id,
+                question_type=question_type,
+                question_text="Question",
+                solution=(
+                    solution if isinstance(solution, str) else json.dumps(solution)
+                ),
+                points_value=points_value,
+            )
+            for question_type, solution, points_value in events
+        ]
+        async with session_maker() as db:
+            db.add_all(event_rows)
+            await db.execute(
+                User.__table__.insert(),
+                [
+                    {
+                        "id": user_id,
+                        "email": f"{user_id}@example.com",
+                        "hashed_password": "",
+                        "points": 0,
+                    }
+                    for user_id in user_ids
+                ],
+            )
+            await db.execute(
+                UserAnswer.__table__.insert(),
+                [
+                    {
+                        "id": text_uuid(),
+                        "user_id": user_ids[user_i],
+                        "event_id": event_rows[event_i].id,
+                        "answer": (
+                            answer if isinstance(answer, str) else json.dumps(answer)
+                        ),
+                        "points": 0,
+                    }
+                    for (event_i, user_i), answer in rows
+                ],
+            )
+            await db.commit()
+
+        async with session_maker() as db:
+            _, elapsed = await timed_async(finalize, db, event_rows)
+        await engine.dispose()
+    return elapsed
+
+
+async def timed_async(func, *args):
+    start = time.perf_counter()
+    result = await func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(2024)
+    print(f"{'answers':>10} {'loop':>10} {'encode':>10} {'score':>10} {'speedup':>8}")
+    for size in SIZES:
+        events, rows = make_tournament(size, rng)
+        expected, loop_time = timed(run_loop, events, rows)
+        columns, encode_time = timed(run_encode, events, rows)
+        (_, _, user_points), score_time = timed(score_answers, *columns, USER_COUNT)
+
+        assert {
+            user_i: int(points)
+            for user_i, points in enumerate(user_points)
+            if user_i in expected
+        } == expected
+
+        print(
+            f"{size:>10} {loop_time:>9.3f}s {encode_time:>9.3f}s "
+            f"{score_time:>9.4f}s {loop_time / score_time:>7.0f}x"
+        )
+
+    print()
+    print(f"{'answers':>10} {'row by row':>11} {'rescore':>10} {'speedup':>8}")
+    for size in DATABASE_SIZES:
+        row_time = asyncio.run(
+            time_database(size, random.Random(size), finalize_row_by_row)
+        )
+        columnar_time = asyncio.run(
+            time_database(size, random.Random(size), finalize_columnar)
+        )
+        print(
+            f"{size:>10} {row_time:>10.3f}s {columnar_time:>9.3f}s "
+            f"{row_time / columnar_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark of concurrent reads and writes on SQLite with and without the
+performance profile (`DB_SQLITE_PERFORMANCE`).
+
+Run with `python -m pickemApi.benchmarks.sqlite_profile`.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker  # noqa: E402
+from sqlalchemy.future import select  # noqa: E402
+
+from pickemApi.core.config import GlobalConfig  # noqa: E402
+from pickemApi.core.database import create_engine_from_config  # noqa: E402
+from pickemApi.models.model import (  # noqa: E402
+    Base,
+    Event,
+    QuestionType,
+    Tournament,
+    User,
+    UserAnswer,
+)
+
+
+DURATION = 5.0
+READERS = 20
+WRITERS = 5
+EVENTS = 40
+
+
+async def run(name: str, performance: bool):
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine_from_config(
+        GlobalConfig(
+            DATABASE_URL=f"sqlite+aiosqlite:///{path}",
+            DB_POOL_SIZE=READERS + WRITERS,
+            DB_SQLITE_PERFORMANCE=performance,
+            DB_SQLITE_BUSY_TIMEOUT_MS=60000,
+        )
+    )
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_maker() as db:
+        tournament = Tournament(id=uuid.uuid4(), name="Bench")
+        events = [
+            Event(
+                tournament_id=tournament.id,
+                question_type=QuestionType.YES_NO,
+                question_text=f"Question {i}",
+                points_value=1,
+            )
+            for i in range(EVENTS)
+        ]
+        db.add(tournament)
+        db.add_all(events)
+        await db.commit()
+    event_ids = [event.id for event in events]
+
+    deadline = time.perf_counter() + DURATION
+    counts = {"reads": 0, "writes": 0}
+
+    async def reader():
+        while time.perf_counter() < deadline:
+            async with session_maker() as db:
+                await db.execute(
+                    select(Event).where(Event.tournament_id == tournament.id)
+                )
+            counts["reads"] += 1
+
+    async def writer():
+        while time.perf_counter() < deadline:
+            async with session_maker() as db:
+                user = User(
+                    email=f"{uuid.uuid4().hex}@example.com",
+                    hashed_password="hash",
+                    username=uuid.uuid4().hex,
+                )
+                db.add(user)
+                await db.flush()
+                db.add_all(
+                    UserAnswer(user_id=user.id, event_id=event_id, answer="yes")
+                    for event_id in event_ids
+                )
+                await db.commit()
+            counts["writes"] += 1
+
+    await asyncio.gather(
+        *(reader() for _ in range(READERS)), *(writer() for _ in range(WRITERS))
+    )
+    await engine.dispose()
+    print(
+        f"{name:<12} {counts['reads'] / DURATION:>8.0f} reads/s "
+        f"{counts['writes'] / DURATION:>8.0f} writes/s"
+    )
+
+
+async def main():
+    print(f"{READERS} readers, {WRITERS} writers, {DURATION:.0f}s each")
+    await run("default", performance=False)
+    await run("performance", performance=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+Benchmark of process startup: imports, engine creation, lifespan and the
+first request.
+
+Run with `python -m pickemApi.benchmarks.startup`. Every boot runs in a
+fresh interpreter against the same SQLite file. The first boot creates the
+schema; later boots only check its version.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BOOTS = 5
+
+
+def boot():
+    """Time one startup phase by phase and print the timings."""
+    timings = {}
+    start = time.perf_counter()
+
+    import fastapi  # noqa: F401
+    import sqlalchemy  # noqa: F401
+
+    timings["third-party imports"] = time.perf_counter() - start
+
+    phase = time.perf_counter()
+    from pickemApi.core import database  # noqa: F401
+
+    timings["models and engine"] = time.perf_counter() - phase
+
+    phase = time.perf_counter()
+    from pickemApi.main import app
+
+    timings["routers and app"] = time.perf_counter() - phase
+
+    import asyncio
+    from httpx import ASGITransport, AsyncClient
+
+    async def serve():
+        phase = time.perf_counter()
+        async with app.router.lifespan_context(app):
+            timings["lifespan startup"] = time.perf_counter() - phase
+            phase = time.perf_counter()
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/standings")
+                response.raise_for_status()
+            timings["first request"] = time.perf_counter() - phase
+
+    asyncio.run(serve())
+    timings["total"] = time.perf_counter() - start
+    print(json.dumps(timings))
+
+
+def main():
+    database_url = (
+        f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    )
+    env = dict(os.environ, DATABASE_URL=database_url)
+    for i in range(BOOTS):
+        output = subprocess.run(
+            [sys.executable, "-m", "pickemApi.benchmarks.startup", "--boot"],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        label = "first boot" if i == 0 else f"boot {i + 1}"
+        print(f"{label}:")
+        for name, seconds in timings.items():
+            print(f"  {name:<22} {seconds * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--boot" in sys.argv:
+        boot()
+    else:
+        main()
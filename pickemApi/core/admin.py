@@ -4,12 +4,12 @@ import asyncio
 import contextlib
 
 from pickemApi.models.usermanager import get_user_manager
-from pickemApi.core.database import get_db, get_user_db
+from pickemApi.core.database import get_write_db, get_user_db
 from pickemApi.schemas.user import UserSuperIn
 from fastapi_users.exceptions import UserAlreadyExists
 
 
-get_async_session_context = contextlib.asynccontextmanager(get_db)
+get_async_session_context = contextlib.asynccontextmanager(get_write_db)
 get_user_db_context = contextlib.asynccontextmanager(get_user_db)
 get_user_manager_context = contextlib.asynccontextmanager(get_user_manager)
 
@@ -10,8 +10,45 @@ class GlobalConfig(BaseSettings):
     """Class with personalized config for app."""
 
     DATABASE_URL: str
+    # Read replicas for read-only endpoints, as a JSON list in the environment
+    DATABASE_REPLICA_URLS: list[str] = []
     DB_FORCE_ROLL_BACK: bool = False
 
+    # Connection pool, ignored for in-memory SQLite
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_RECYCLE: int = -1
+    # asyncpg prepared statement cache, set to 0 behind pgbouncer
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # SQLite performance profile: WAL journal and tuned pragmas on connect
+    DB_SQLITE_PERFORMANCE: bool = False
+    DB_SQLITE_CACHE_SIZE: int = -64000  # negative values are KiB
+    DB_SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    DB_SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # Cache of users resolved from tokens, 0 entries disables it
+    AUTH_USER_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30
+
+    # Short-lived tokens with role claims; admin routes then skip the user lookup
+    AUTH_CLAIMS_ENABLED: bool = False
+    AUTH_CLAIMS_LIFETIME_SECONDS: int = 900
+
+    # Argon2 runs in this many threads; more pending calls get a 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Serialized tournament responses kept per worker, 0 disables the cache
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # Group commit of answer submissions, flushed every N ms or M rows
+    ANSWER_BUFFER_ENABLED: bool = False
+    ANSWER_BUFFER_FLUSH_MS: int = 10
+    ANSWER_BUFFER_MAX_ROWS: int = 500
+
     model_config = SettingsConfigDict(
         env_file=f".env.{os.getenv('ENV_STATE', 'development')}"
     )
@@ -2,40 +2,304 @@
 Set up database.
 """
 
+import itertools
+import logging
+import time
 from fastapi import FastAPI, Depends
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    event,
+    exists,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import load_only, make_transient_to_detached
 from fastapi_users.db import SQLAlchemyUserDatabase
 
-from pickemApi.models.model import User, Base
+from pickemApi.models.model import (
+    SCHEMA_VERSION,
+    Base,
+    Event,
+    LeaderboardEntry,
+    SchemaVersion,
+    User,
+    UserAnswer,
+)
 
 from contextlib import asynccontextmanager
-from pickemApi.core.config import config
+from pickemApi.core.config import GlobalConfig, config
+from pickemApi.core.user_cache import user_cache
 
+logger = logging.getLogger(__name__)
 
-engine = create_async_engine(
-    config.DATABASE_URL, connect_args={"check_same_thread": False}
-)
+
+def create_engine_from_config(
+    settings: GlobalConfig, database_url: Optional[str] = None
+) -> AsyncEngine:
+    """Create the async engine with pool and driver settings for its dialect.
+
+    Connects to `database_url` if given, otherwise to `settings.DATABASE_URL`.
+    """
+    url = make_url(database_url or settings.DATABASE_URL)
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    connect_args = {}
+
+    if url.get_backend_name() == "sqlite":
+        connect_args["check_same_thread"] = False
+        in_memory = url.database in (None, "", ":memory:")
+    else:
+        in_memory = False
+
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "asyncpg":
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+        )
+        connect_args["statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+
+    if not in_memory:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+
+    new_engine = create_async_engine(url, connect_args=connect_args, **options)
+    if url.get_backend_name() == "sqlite" and settings.DB_SQLITE_PERFORMANCE:
+        apply_sqlite_performance_profile(new_engine, settings)
+    return new_engine
+
+
+def apply_sqlite_performance_profile(
+    sqlite_engine: AsyncEngine, settings: GlobalConfig
+) -> None:
+    """Set WAL journaling and tuned pragmas on every new SQLite connection.
+
+    In WAL mode readers no longer wait for a writer's commit.
+    """
+    pragmas = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": settings.DB_SQLITE_CACHE_SIZE,
+        "mmap_size": settings.DB_SQLITE_MMAP_SIZE,
+        "temp_store": "MEMORY",
+        "busy_timeout": settings.DB_SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+    @event.listens_for(sqlite_engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+engine = create_engine_from_config(config)
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+replica_engines = [
+    create_engine_from_config(config, replica_url)
+    for replica_url in config.DATABASE_REPLICA_URLS
+]
+# Read-only sessions go to the replicas in turn, or to the primary without any.
+# They run in autocommit mode, so the driver sends no BEGIN or ROLLBACK.
+read_session_makers = itertools.cycle(
+    [
+        async_sessionmaker(
+            read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        for read_engine in replica_engines or [engine]
+    ]
+)
+
+
+def _upgrade_to_1(conn: Connection) -> None:
+    """Add the points version column and the answer indexes to existing tables.
+
+    Databases created before schema versions were recorded have neither.
+    Duplicate answers of a user to an event are removed, keeping the scored
+    one, so the unique index can be built. Every step is skipped when
+    already applied, so fresh databases pass through unchanged.
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("users")}
+    if "points_version" not in columns:
+        conn.execute(
+            text("ALTER TABLE users ADD COLUMN points_version INTEGER DEFAULT 0")
+        )
+
+    # Of duplicate answers of a user to an event, keep the one with the most
+    # points, then the lowest id, and take the others' points off the user
+    answers = UserAnswer.__table__
+    kept = answers.alias()
+    answer_points = func.coalesce(answers.c.points, 0)
+    kept_points = func.coalesce(kept.c.points, 0)
+    duplicates = conn.execute(
+        select(answers.c.id, answers.c.user_id, answer_points).where(
+            exists().where(
+                kept.c.user_id == answers.c.user_id,
+                kept.c.event_id == answers.c.event_id,
+                or_(
+                    kept_points > answer_points,
+                    and_(kept_points == answer_points, kept.c.id < answers.c.id),
+                ),
+            )
+        )
+    ).all()
+    if duplicates:
+        user_delta = {}
+        for _, user_id, points in duplicates:
+            if points:
+                user_delta[user_id] = user_delta.get(user_id, 0) + points
+        if user_delta:
+            users = User.__table__
+            conn.execute(
+                update(users)
+                .where(users.c.id == bindparam("user_id"))
+                .values(points=users.c.points - bindparam("delta")),
+                [
+                    {"user_id": user_id, "delta": delta}
+                    for user_id, delta in user_delta.items()
+                ],
+            )
+        conn.execute(
+            delete(answers).where(answers.c.id.in_([row.id for row in duplicates]))
+        )
+        logger.warning(f"Removed {len(duplicates)} duplicate answers.")
+    for table in (User.__table__, answers):
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def _upgrade_to_3(conn: Connection) -> None:
+    """Add the user id to the leaderboard rank index and rebuild leaderboards.
+
+    Scoring now moves stored leaderboards by point deltas instead of
+    rebuilding them, so entries must first match the answer points they
+    start from, including for tournaments scored before leaderboards existed.
+    """
+    entries = LeaderboardEntry.__table__
+    for index in entries.indexes:
+        index.drop(conn, checkfirst=True)
+        index.create(conn)
+
+    totals = (
+        select(
+            Event.tournament_id.label("tournament_id"),
+            UserAnswer.user_id.label("user_id"),
+            func.sum(func.coalesce(UserAnswer.points, 0)).label("points"),
+        )
+        .join(Event, UserAnswer.event_id == Event.id)
+        .group_by(Event.tournament_id, UserAnswer.user_id)
+        .subquery()
+    )
+    ranked = select(
+        totals.c.tournament_id,
+        totals.c.user_id,
+        totals.c.points,
+        func.dense_rank().over(
+            partition_by=totals.c.tournament_id, order_by=totals.c.points.desc()
+        ),
+    )
+    conn.execute(delete(entries))
+    conn.execute(
+        insert(entries).from_select(
+            ["tournament_id", "user_id", "points", "rank"], ranked
+        )
+    )
+
+
+# Changes to existing tables, applied in order after create_all adds new tables
+SCHEMA_UPGRADES = {1: _upgrade_to_1, 3: _upgrade_to_3}
+
+
+async def ensure_schema(schema_engine: AsyncEngine) -> bool:
+    """Bring the database to the current schema version.
+
+    A matching version costs a single query instead of introspecting every
+    table. Otherwise missing tables are created and the upgrade steps after
+    the recorded version run, all in one transaction. Databases without a
+    recorded version get every step. Returns whether DDL was run.
+    """
+    try:
+        async with schema_engine.connect() as conn:
+            version = await conn.scalar(select(SchemaVersion.version))
+    except DBAPIError:  # No schema_version table yet
+        version = None
+    if version == SCHEMA_VERSION:
+        return False
+
+    async with schema_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for step in range((version or 0) + 1, SCHEMA_VERSION + 1):
+            if step in SCHEMA_UPGRADES:
+                await conn.run_sync(SCHEMA_UPGRADES[step])
+        await conn.execute(delete(SchemaVersion))
+        await conn.execute(insert(SchemaVersion).values(id=1, version=SCHEMA_VERSION))
+    return True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    from pickemApi.services.answer_buffer import answer_buffer
+    from pickemApi.services.standings import global_standings
+
+    await ensure_schema(engine)
+
+    async with async_session_maker() as db:
+        await global_standings.load(db)
 
     yield
 
+    await answer_buffer.close()
     await engine.dispose()
+    for replica in replica_engines:
+        await replica.dispose()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Session for endpoints that only read; it is never committed.
+
+    Sessions are bound to the read replicas round-robin, so their data may
+    lag behind the primary. Reading back one's own writes belongs in the
+    write session. Connections run in autocommit mode, so each statement
+    runs on its own and no transaction round trips are made.
+    """
+    async with next(read_session_makers)() as db:
+        yield db
 
 
 # Dependency do uzyskiwania sesji
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_write_db() -> AsyncGenerator[AsyncSession, None]:
+    """Session for endpoints that write; it is committed once at the end.
+
+    Endpoints flush instead of committing so constraint errors still surface
+    while the request is handled; the commit happens when the dependency exits.
+    """
     async with async_session_maker() as db:
         try:
             yield db
@@ -51,5 +315,75 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await db.close()
 
 
-async def get_user_db(session: AsyncSession = Depends(get_db)):
-    yield SQLAlchemyUserDatabase(session, User)
+class AuthUserDatabase(SQLAlchemyUserDatabase):
+    """User database that loads only the columns authentication needs by id.
+
+    Every authenticated request resolves its user through `get`, so other
+    columns are not loaded and raise instead of lazy loading when accessed.
+    Loaded users are kept in `user_cache` and served without a query until
+    `UserManager` writes them, which always goes through `update` or `delete`.
+    """
+
+    auth_columns = (
+        User.id,
+        User.email,
+        User.hashed_password,
+        User.username,
+        User.is_active,
+        User.is_superuser,
+        User.is_verified,
+    )
+
+    async def get(self, id):
+        start = time.perf_counter()
+        fields = user_cache.get(id)
+        if fields is not None:
+            user = User(**fields)
+            make_transient_to_detached(user)
+            user_cache.record(True, time.perf_counter() - start)
+            return user
+
+        statement = (
+            select(User)
+            .where(User.id == id)
+            .options(load_only(*self.auth_columns, raiseload=True))
+        )
+        user = await self._get_user(statement)
+        if user is not None:
+            fields = {
+                column.key: getattr(user, column.key) for column in self.auth_columns
+            }
+            user_cache.set(id, fields)
+        user_cache.record(False, time.perf_counter() - start)
+        return user
+
+    async def update(self, user, update_dict):
+        user = await super().update(user, update_dict)
+        user_cache.invalidate(user.id)
+        return user
+
+    async def delete(self, user):
+        await super().delete(user)
+        user_cache.invalidate(user.id)
+
+
+async def get_user_db(session: AsyncSession = Depends(get_write_db)):
+    yield AuthUserDatabase(session, User)
+
+
+def dialect_insert(db: AsyncSession, table):
+    """Return an INSERT for `table` that supports ON CONFLICT on the session's database."""
+    if db.bind.dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def dialect_random_uuid(db: AsyncSession):
+    """Return a SQL expression generating a new UUID per row on the session's database.
+
+    SQLite has no UUID function, so 16 random bytes are rendered as the hex
+    string that the `UUID` column type stores there.
+    """
+    if db.bind.dialect.name == "postgresql":
+        return func.gen_random_uuid()
+    return func.lower(func.hex(func.randomblob(16)))
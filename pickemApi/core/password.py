@@ -0,0 +1,51 @@
+"""
+Password hashing off the event loop.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+from pickemApi.core.config import config
+
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingPool:
+    """Run Argon2 hashing and verification in a bounded thread pool.
+
+    argon2 releases the GIL while hashing, so the workers hash in parallel
+    while the event loop keeps serving other requests. At most `max_pending`
+    calls may run or wait; beyond that callers fail fast with 503 instead
+    of queueing behind a login storm.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password"
+        )
+
+    async def run(self, function, *args):
+        if self.pending >= self.max_pending:
+            logger.warning(f"Password hashing pool saturated ({self.pending} pending).")
+            raise HTTPException(
+                status_code=503,
+                detail="Too many sign-ins in progress, try again shortly.",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, function, *args)
+        finally:
+            self.pending -= 1
+
+
+password_pool = PasswordHashingPool(
+    config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_MAX_PENDING
+)
@@ -2,11 +2,19 @@
 Security configuration for API.
 """
 
+import time
+import uuid
+from typing import Optional
+
+import jwt
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
     JWTStrategy,
 )
+from fastapi_users.jwt import decode_jwt, generate_jwt
+
+from pickemApi.core.config import config
 
 
 SECRET = "SECRET"
@@ -14,7 +22,85 @@ SECRET = "SECRET"
 bearer_transport = BearerTransport(tokenUrl="auth/jwt/login")
 
 
+class TokenRevocations:
+    """In-memory list of users whose claims tokens issued so far are revoked.
+
+    Entries are kept for the lifetime of claims tokens, after which every
+    token issued before the revocation has expired anyway. Revocations only
+    apply in the worker that handled the change; other workers accept the
+    token until it expires.
+    """
+
+    def __init__(self, lifetime_seconds: int):
+        self.lifetime_seconds = lifetime_seconds
+        self._revoked = {}
+
+    def revoke(self, user_id: uuid.UUID) -> None:
+        now = time.time()
+        oldest = now - self.lifetime_seconds
+        self._revoked = {
+            key: revoked_at
+            for key, revoked_at in self._revoked.items()
+            if revoked_at >= oldest
+        }
+        self._revoked[str(user_id)] = now
+
+    def is_revoked(self, user_id: str, issued_at: int) -> bool:
+        revoked_at = self._revoked.get(user_id)
+        if revoked_at is None:
+            return False
+        if revoked_at < time.time() - self.lifetime_seconds:
+            del self._revoked[user_id]
+            return False
+        return issued_at <= revoked_at
+
+
+token_revocations = TokenRevocations(config.AUTH_CLAIMS_LIFETIME_SECONDS)
+
+
+class ClaimsJWTStrategy(JWTStrategy):
+    """JWT strategy whose tokens also carry the user's active and superuser state.
+
+    Admin routes can then authorize from the token alone, see `read_claims`.
+    """
+
+    async def write_token(self, user) -> str:
+        data = {
+            "sub": str(user.id),
+            "aud": self.token_audience,
+            "iat": int(time.time()),
+            "active": user.is_active,
+            "superuser": user.is_superuser,
+        }
+        return generate_jwt(
+            data, self.encode_key, self.lifetime_seconds, algorithm=self.algorithm
+        )
+
+    def read_claims(self, token: Optional[str]) -> Optional[dict]:
+        """Return the claims of a valid, unrevoked claims token, otherwise None."""
+        if token is None:
+            return None
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+            )
+        except jwt.PyJWTError:
+            return None
+        if not {"sub", "iat", "active", "superuser"} <= data.keys():
+            return None
+        if token_revocations.is_revoked(data["sub"], data["iat"]):
+            return None
+        return data
+
+
+claims_jwt_strategy = ClaimsJWTStrategy(
+    secret=SECRET, lifetime_seconds=config.AUTH_CLAIMS_LIFETIME_SECONDS
+)
+
+
 def get_jwt_strategy() -> JWTStrategy:
+    if config.AUTH_CLAIMS_ENABLED:
+        return claims_jwt_strategy
     return JWTStrategy(secret=SECRET, lifetime_seconds=3600)
 
 
@@ -0,0 +1,79 @@
+"""
+In-process cache of the user fields authentication needs.
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from pickemApi.core.config import config
+
+
+class UserCache:
+    """LRU cache with a time to live of auth user fields, keyed by user id.
+
+    Entries are dropped when the user is written through the user database.
+    Other workers keep their entries until the TTL expires, which bounds how
+    long a change made elsewhere can go unnoticed. A size of 0 disables it.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def get(self, user_id: uuid.UUID) -> Optional[dict]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, fields = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return fields
+
+    def set(self, user_id: uuid.UUID, fields: dict) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, fields)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def record(self, hit: bool, seconds: float) -> None:
+        """Count a lookup and how long resolving the user took."""
+        if hit:
+            self.hits += 1
+            self.hit_seconds += seconds
+        else:
+            self.misses += 1
+            self.miss_seconds += seconds
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        hit_ms = self.hit_seconds * 1000 / self.hits if self.hits else 0.0
+        miss_ms = self.miss_seconds * 1000 / self.misses if self.misses else 0.0
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "mean_hit_ms": hit_ms,
+            "mean_miss_ms": miss_ms,
+            "saved_ms": self.hits * (miss_ms - hit_ms) if self.misses else 0.0,
+        }
+
+
+user_cache = UserCache(config.AUTH_USER_CACHE_SIZE, config.AUTH_USER_CACHE_TTL_SECONDS)
@@ -11,6 +11,7 @@ from pickemApi.routers.tournaments import router as tournament_router
 from pickemApi.routers.teams import router as team_router
 from pickemApi.routers.events import router as event_router
 from pickemApi.routers.user_answer import router as user_answer_router
+from pickemApi.routers.standings import router as standings_router
 
 
 app = FastAPI(lifespan=lifespan)
@@ -21,3 +22,4 @@ app.include_router(tournament_router, prefix="", tags=["tournament"])
 app.include_router(team_router, prefix="", tags=["teams"])
 app.include_router(event_router, prefix="", tags=["events"])
 app.include_router(user_answer_router, prefix="", tags=["user_answers"])
+app.include_router(standings_router, prefix="", tags=["standings"])
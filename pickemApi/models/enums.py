@@ -9,3 +9,13 @@ class QuestionType(str, Enum_class):
     YES_NO = "yes_no"
     SINGLE_CHOICE = "single_choice"
     MULTIPLE_CHOICE = "multiple_choice"
+
+
+class FinalizeMode(str, Enum_class):
+    PYTHON = "python"
+    SQL = "sql"
+
+
+class AnswerConflictMode(str, Enum_class):
+    REJECT = "reject"
+    REPLACE = "replace"
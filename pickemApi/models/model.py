@@ -14,6 +14,7 @@ from sqlalchemy import (
     Date,
     Table,
     Enum,
+    Index,
 )
 from sqlalchemy.orm import relationship, DeclarativeBase
 
@@ -44,8 +45,9 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     password_hash = Column(String)
     is_admin = Column(Boolean, default=False)
     points = Column(Integer, default=0)
+    points_version = Column(Integer, default=0, index=True)
 
-    answers = relationship("UserAnswer", back_populates="user", lazy="selectin")
+    answers = relationship("UserAnswer", back_populates="user", lazy="raise")
 
 
 class Tournament(Base):
@@ -59,10 +61,10 @@ class Tournament(Base):
         "Team",
         secondary=tournament_teams,
         back_populates="tournaments",
-        lazy="selectin",
+        lazy="raise",
     )
 
-    events = relationship("Event", back_populates="tournament", lazy="selectin")
+    events = relationship("Event", back_populates="tournament", lazy="raise")
 
 
 class Team(Base):
@@ -76,7 +78,7 @@ class Team(Base):
         "Tournament",
         secondary=tournament_teams,
         back_populates="teams",
-        lazy="selectin",
+        lazy="raise",
     )
 
 
@@ -90,12 +92,16 @@ class Event(Base):
     solution = Column(String, nullable=True)
     points_value = Column(Integer, nullable=False)
 
-    tournament = relationship("Tournament", back_populates="events", lazy="selectin")
-    answers = relationship("UserAnswer", back_populates="event", lazy="selectin")
+    tournament = relationship("Tournament", back_populates="events", lazy="raise")
+    answers = relationship("UserAnswer", back_populates="event", lazy="raise")
 
 
 class UserAnswer(Base):
     __tablename__ = "user_answers"
+    __table_args__ = (
+        Index("ix_user_answers_user_event", "user_id", "event_id", unique=True),
+        Index("ix_user_answers_event_id_id", "event_id", "id"),
+    )
 
     id = Column(UUID, primary_key=True, index=True, default=uuid.uuid4)
     user_id = Column(UUID, ForeignKey("users.id"))
@@ -103,5 +109,49 @@ class UserAnswer(Base):
     answer = Column(String, nullable=False)
     points = Column(Integer, default=0)
 
-    user = relationship("User", back_populates="answers", lazy="selectin")
-    event = relationship("Event", back_populates="answers", lazy="selectin")
+    user = relationship("User", back_populates="answers", lazy="raise")
+    event = relationship("Event", back_populates="answers", lazy="raise")
+
+
+class LeaderboardEntry(Base):
+    __tablename__ = "leaderboard_entries"
+    __table_args__ = (
+        Index(
+            "ix_leaderboard_entries_tournament_rank",
+            "tournament_id",
+            "rank",
+            "user_id",
+        ),
+    )
+
+    tournament_id = Column(UUID, ForeignKey("tournaments.id"), primary_key=True)
+    user_id = Column(UUID, ForeignKey("users.id"), primary_key=True)
+    points = Column(Integer, nullable=False)
+    rank = Column(Integer, nullable=False)
+
+
+class StandingsState(Base):
+    __tablename__ = "standings_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+# Bumped by every write to a tournament's teams, events, solutions or scores
+class TournamentVersion(Base):
+    __tablename__ = "tournament_versions"
+
+    tournament_id = Column(UUID, ForeignKey("tournaments.id"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+# Bump whenever a model change needs DDL. create_all only adds new tables;
+# new columns and indexes on existing tables need a step in SCHEMA_UPGRADES
+SCHEMA_VERSION = 3
+
+
+class SchemaVersion(Base):
+    __tablename__ = "schema_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False)
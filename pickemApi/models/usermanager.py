@@ -3,15 +3,24 @@ Logic of FastAPI Users.
 """
 
 import uuid
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from fastapi import Depends, Request
-from fastapi_users import BaseUserManager, UUIDIDMixin, FastAPIUsers
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, UUIDIDMixin, FastAPIUsers, exceptions
+from fastapi_users.schemas import BaseUserCreate
 
 from ..core.database import get_user_db
 
 from pickemApi.models.model import User
-from pickemApi.core.security import auth_backend
+from pickemApi.core.password import password_pool
+from pickemApi.core.config import config
+from pickemApi.core.security import (
+    auth_backend,
+    bearer_transport,
+    claims_jwt_strategy,
+    token_revocations,
+)
 
 
 SECRET = "SECRET"
@@ -24,6 +33,76 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     verification_token_secret = SECRET
     test_reset_password_token = None
 
+    # Same flows as BaseUserManager, with Argon2 run in `password_pool`
+
+    async def create(
+        self,
+        user_create: BaseUserCreate,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        await self.validate_password(user_create.password, user_create)
+
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise exceptions.UserAlreadyExists()
+
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop("password")
+        user_dict["hashed_password"] = await password_pool.run(
+            self.password_helper.hash, password
+        )
+
+        created_user = await self.user_db.create(user_dict)
+
+        await self.on_after_register(created_user, request)
+
+        return created_user
+
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> Optional[User]:
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Run the hasher to mitigate timing attack
+            await password_pool.run(self.password_helper.hash, credentials.password)
+            return None
+
+        # Return the connection to the pool instead of holding it while hashing
+        await self.user_db.session.commit()
+        verified, updated_password_hash = await password_pool.run(
+            self.password_helper.verify_and_update,
+            credentials.password,
+            user.hashed_password,
+        )
+        if not verified:
+            return None
+        # Update password hash to a more robust one if needed
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+
+        return user
+
+    async def _update(self, user: User, update_dict: Dict[str, Any]) -> User:
+        password = update_dict.get("password")
+        if password is None:
+            return await super()._update(user, update_dict)
+
+        await self.validate_password(password, user)
+        update_dict = {
+            key: value for key, value in update_dict.items() if key != "password"
+        }
+        # Fields other than email and password are written as given
+        update_dict["hashed_password"] = await password_pool.run(
+            self.password_helper.hash, password
+        )
+        return await super()._update(user, update_dict)
+
     async def on_after_register(
         self, user: User, request: Request | None = None
     ) -> None:
@@ -41,6 +120,19 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     ):
         print(f"Verification requested for user {user.id}. Verification token: {token}")
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: Dict[str, Any],
+        request: Optional[Request] = None,
+    ):
+        # Claims tokens must not outlive a deactivation or a role change
+        if "is_active" in update_dict or "is_superuser" in update_dict:
+            token_revocations.revoke(user.id)
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        token_revocations.revoke(user.id)
+
 
 async def get_user_manager(user_db=Depends(get_user_db)):
     yield UserManager(user_db)
@@ -50,4 +142,24 @@ fastapi_users = FastAPIUsers[User, uuid.UUID](get_user_manager, [auth_backend])
 
 current_active_user = fastapi_users.current_user(active=True)
 
-current_admin_user = fastapi_users.current_user(active=True, superuser=True)
+
+async def current_admin_from_claims(
+    token: Optional[str] = Depends(bearer_transport.scheme),
+) -> User:
+    """Authorize an admin from the claims of the token, without loading the user.
+
+    The returned user is not loaded from the database and only has its id,
+    `is_active` and `is_superuser` set.
+    """
+    claims = claims_jwt_strategy.read_claims(token)
+    if claims is None or not claims["active"]:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    if not claims["superuser"]:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return User(id=uuid.UUID(claims["sub"]), is_active=True, is_superuser=True)
+
+
+if config.AUTH_CLAIMS_ENABLED:
+    current_admin_user = current_admin_from_claims
+else:
+    current_admin_user = fastapi_users.current_user(active=True, superuser=True)
@@ -3,12 +3,18 @@ Routers for managing answers of users APIs.
 """
 
 import uuid
+from typing import Optional
 
-from fastapi import Depends, APIRouter
-from pickemApi.core.database import AsyncSession, get_db
-from pickemApi.schemas.events import EventSolutionCreate, EventResponse
+from fastapi import Depends, APIRouter, HTTPException, Query
+from sqlalchemy.future import select
+from pickemApi.core.database import AsyncSession, get_read_db, get_write_db
+from pickemApi.schemas.events import (
+    EventSolutionCreate,
+    EventResponse,
+    UserAnswerPage,
+)
 from pickemApi.models.usermanager import current_admin_user
-from pickemApi.models.model import User
+from pickemApi.models.model import Event, User, UserAnswer
 from pickemApi.services.event_solution_service import set_event_solution_service
 
 router = APIRouter()
@@ -20,9 +26,36 @@ router = APIRouter()
 async def set_solution(
     event_id: uuid.UUID,
     solution_data: EventSolutionCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     admin_user: User = Depends(current_admin_user),
 ):
     """Sets the correct solution for a specific event by an admin."""
     event = await set_event_solution_service(event_id, solution_data, db)
     return event
+
+
+@router.get("/events/{event_id}/answers", response_model=UserAnswerPage)
+async def get_event_answers(
+    event_id: uuid.UUID,
+    after: Optional[uuid.UUID] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Response a page of users' answers to an event.
+
+    Pages are ordered by answer id; pass `next_after` of a page as `after`
+    to get the next one.
+    """
+    statement = select(UserAnswer).where(UserAnswer.event_id == event_id)
+    if after is not None:
+        statement = statement.where(UserAnswer.id > after)
+    result = await db.execute(statement.order_by(UserAnswer.id).limit(limit))
+    answers = result.scalars().all()
+
+    if not answers and after is None and not await db.get(Event, event_id):
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    return {
+        "answers": answers,
+        "next_after": answers[-1].id if len(answers) == limit else None,
+    }
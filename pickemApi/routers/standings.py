@@ -0,0 +1,31 @@
+"""
+Routers for global season standings.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from pickemApi.core.database import AsyncSession, get_read_db
+from pickemApi.models.usermanager import current_active_user
+from pickemApi.models.model import User
+from pickemApi.schemas.events import LeaderboardEntryResponse
+from pickemApi.services.standings import global_standings
+
+router = APIRouter()
+
+
+@router.get("/standings", response_model=list[LeaderboardEntryResponse])
+async def get_standings(
+    start_rank: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Response a page of users ordered by their total points."""
+    return await global_standings.page(start_rank, limit, db)
+
+
+@router.get("/standings/me", response_model=LeaderboardEntryResponse)
+async def get_my_standing(
+    db: AsyncSession = Depends(get_read_db),
+    user: User = Depends(current_active_user),
+):
+    """Response the user's total points and global rank."""
+    return await global_standings.rank_of(user.id, db)
@@ -5,11 +5,13 @@ Routers for managemant of teams.
 import uuid
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from pickemApi.core.database import get_db
+from pickemApi.core.database import get_write_db
 from pickemApi.models.usermanager import current_admin_user
 from pickemApi.models.model import Team, User
+from pickemApi.schemas.events import TeamImportResult
+from pickemApi.services.team_import import import_teams
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -17,7 +19,8 @@ router = APIRouter()
 
 @router.post("/teams/sample")
 async def create_sample_teams(
-    db: AsyncSession = Depends(get_db), current_user: User = Depends(current_admin_user)
+    db: AsyncSession = Depends(get_write_db),
+    current_user: User = Depends(current_admin_user),
 ):
     logger.info("Creating sample teams.")
     sample_teams = [
@@ -26,7 +29,7 @@ async def create_sample_teams(
     ]
     db.add_all(sample_teams)
     try:
-        await db.commit()
+        await db.flush()
         logger.info("Succesfully added 10 sample teams.")
     except Exception as e:
         await db.rollback()
@@ -34,3 +37,20 @@ async def create_sample_teams(
         raise HTTPException(status_code=400, detail=str(e))
 
     return {"message": "10 sample teams added to the database."}
+
+
+@router.post("/teams/import", response_model=TeamImportResult)
+async def import_teams_endpoint(
+    request: Request,
+    db: AsyncSession = Depends(get_write_db),
+    current_user: User = Depends(current_admin_user),
+):
+    """Import teams from a streamed CSV or NDJSON body.
+
+    The body is parsed line by line as it arrives and valid teams are
+    inserted in batches, so uploads of any size use bounded memory.
+    """
+    logger.info("Importing teams.")
+    return await import_teams(
+        request.headers.get("content-type", ""), request.stream(), db
+    )
@@ -4,31 +4,113 @@ Routers for managemant of tournaments.
 
 import logging
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Awaitable, Callable
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 from pickemApi.schemas.events import (
     TournamentCreate,
     TournamentResponse,
     EventResponse,
     EventCreate,
+    EventBulkCreate,
+    BulkSolutionCreate,
     QuestionType,
     TeamResponse,
+    LeaderboardEntryResponse,
+    TournamentTeamsAdd,
+    TournamentTeamsResult,
 )
-from pickemApi.core.database import get_db
-from pickemApi.models.usermanager import current_admin_user
+from pickemApi.core.database import get_read_db, get_write_db
+from pickemApi.models.usermanager import current_active_user, current_admin_user
+from pickemApi.models.enums import FinalizeMode
 from pickemApi.models.model import User, Tournament, Team, Event
-from pickemApi.services.tournament import finalize_tournament
+from pickemApi.services.event_solution_service import set_event_solutions_service
+from pickemApi.services.leaderboard import (
+    get_leaderboard,
+    get_leaderboard_around_user,
+)
+from pickemApi.services.response_cache import (
+    bump_tournament_version,
+    etag_matches,
+    get_tournament_version,
+    response_cache,
+    tournament_etag,
+)
+from pickemApi.services.tournament import (
+    add_teams_to_tournament,
+    clone_events,
+    create_events,
+    finalize_tournament,
+)
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+TEAMS_ADAPTER = TypeAdapter(list[TeamResponse])
+EVENTS_ADAPTER = TypeAdapter(list[EventResponse])
+
+# Clients may store tournament reads but must revalidate them with the ETag
+PUBLIC_CACHE_HEADERS = {"Cache-Control": "public, no-cache"}
+PRIVATE_CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+
+async def tournament_cache_headers(
+    tournament_id: uuid.UUID, cache_headers: dict, db: AsyncSession
+) -> tuple[int, dict]:
+    """Return the tournament's data version and the caching headers of its reads.
+
+    Only tournaments that exist have been written, so the tournament itself
+    is looked up only while its version is 0. Unknown tournaments raise 404
+    before any ETag is compared.
+    """
+    version = await get_tournament_version(tournament_id, db)
+    if not version and not await db.scalar(
+        select(Tournament.id).where(Tournament.id == tournament_id)
+    ):
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    return version, {"ETag": tournament_etag(tournament_id, version), **cache_headers}
+
+
+def not_modified(request: Request, headers: dict) -> bool:
+    return etag_matches(request.headers.get("if-none-match"), headers["ETag"])
+
+
+async def cached_tournament_response(
+    request: Request,
+    tournament_id: uuid.UUID,
+    route: str,
+    adapter: TypeAdapter,
+    load: Callable[[], Awaitable[list]],
+    db: AsyncSession,
+) -> Response:
+    """Serve the JSON body cached for the tournament's current data version.
+
+    A request whose If-None-Match names the current ETag gets an empty 304.
+    On a miss `load` queries the objects, which are serialized once and kept
+    until a write bumps the version. Errors raised by `load` are not cached.
+    """
+    version, headers = await tournament_cache_headers(
+        tournament_id, PUBLIC_CACHE_HEADERS, db
+    )
+    if not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    key = (tournament_id, route)
+    body = response_cache.get(key, version)
+    if body is None:
+        objects = await load()
+        body = adapter.dump_json(adapter.validate_python(objects, from_attributes=True))
+        response_cache.set(key, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.post("/tournaments/", response_model=TournamentResponse, status_code=201)
 async def create_tournament(
     tournament: TournamentCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: User = Depends(current_admin_user),
 ):
     """Creating new tournament by admin."""
@@ -36,8 +118,9 @@ async def create_tournament(
     new_tournament = Tournament(name=tournament.name, date=tournament.date)
     db.add(new_tournament)
     try:
-        await db.commit()
-        await db.refresh(new_tournament)
+        await db.flush()
+        await db.refresh(new_tournament, ["teams"])
+        await bump_tournament_version(new_tournament.id, db)
         logger.info(f"Succesfully created tournament: {new_tournament}.")
     except Exception as e:
         await db.rollback()
@@ -50,7 +133,7 @@ async def create_tournament(
 @router.post("/tournaments/{tournament_id}/teams/add_last")
 async def add_last_teams_to_tournament(
     tournament_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     current_user: User = Depends(current_admin_user),
 ):
     # Fetch the last 10 teams from the database
@@ -63,10 +146,13 @@ async def add_last_teams_to_tournament(
                 status_code=404, detail="No teams found in the database."
             )
 
-        tournament = await db.get(Tournament, tournament_id)
+        tournament = await db.get(
+            Tournament, tournament_id, options=[selectinload(Tournament.teams)]
+        )
         tournament.teams.extend(last_teams)
 
-        await db.commit()
+        await db.flush()
+        await bump_tournament_version(tournament_id, db)
         logger.info(f"Added last 10 teams to tournament {tournament_id}")
 
     except HTTPException as http_ex:
@@ -81,15 +167,41 @@ async def add_last_teams_to_tournament(
     return {"message": "Last 10 teams added to the tournament."}
 
 
+@router.post(
+    "/tournaments/{tournament_id}/teams", response_model=TournamentTeamsResult
+)
+async def add_teams(
+    tournament_id: uuid.UUID,
+    teams: TournamentTeamsAdd,
+    db: AsyncSession = Depends(get_write_db),
+    current_user: User = Depends(current_admin_user),
+):
+    """Assign teams to the tournament by id; unknown and assigned ids are skipped."""
+    if not await db.get(Tournament, tournament_id):
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    added = await add_teams_to_tournament(tournament_id, teams.team_ids, db)
+    return {"added": added}
+
+
 @router.get("/tournaments/{tournament_id}/teams", response_model=list[TeamResponse])
-async def get_teams(tournament_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+async def get_teams(
+    tournament_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
     """Response all teams of tournament."""
-    tournament = await db.get(Tournament, tournament_id)
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
-    list_of_tournament = tournament.teams
 
-    return list_of_tournament
+    async def load():
+        tournament = await db.get(
+            Tournament, tournament_id, options=[selectinload(Tournament.teams)]
+        )
+        if not tournament:
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        return tournament.teams
+
+    return await cached_tournament_response(
+        request, tournament_id, "teams", TEAMS_ADAPTER, load, db
+    )
 
 
 @router.post(
@@ -98,7 +210,7 @@ async def get_teams(tournament_id: uuid.UUID, db: AsyncSession = Depends(get_db)
 async def create_event(
     tournament_id: uuid.UUID,
     event: EventCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
     admin_user: User = Depends(current_admin_user),
 ):
     """Creating a new event by admin."""
@@ -128,8 +240,9 @@ async def create_event(
     )
     db.add(new_event)
     try:
-        await db.commit()
+        await db.flush()
         await db.refresh(new_event)
+        await bump_tournament_version(tournament_id, db)
         logger.info(f"Succesfully created event: {new_event}")
     except Exception as e:
         await db.rollback()
@@ -139,22 +252,130 @@ async def create_event(
     return new_event
 
 
-@router.get("/tournaments/{tournament_id}/events", response_model=list[EventResponse])
-async def get_teams(tournament_id: uuid.UUID, db: AsyncSession = Depends(get_db)):  # noqa: F811
-    """Response all events of tournament."""
-    tournament = await db.get(Tournament, tournament_id)
-    if not tournament:
+@router.post(
+    "/tournaments/{tournament_id}/events/bulk",
+    response_model=list[EventResponse],
+    status_code=201,
+)
+async def create_events_bulk(
+    tournament_id: uuid.UUID,
+    events: EventBulkCreate,
+    db: AsyncSession = Depends(get_write_db),
+    admin_user: User = Depends(current_admin_user),
+):
+    """Creating many events of a tournament at once by admin."""
+    if not await db.get(Tournament, tournament_id):
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    return await create_events(tournament_id, events.events, db)
+
+
+@router.post(
+    "/tournaments/{tournament_id}/events/clone",
+    response_model=list[EventResponse],
+    status_code=201,
+)
+async def clone_tournament_events(
+    tournament_id: uuid.UUID,
+    source_tournament_id: uuid.UUID,
+    db: AsyncSession = Depends(get_write_db),
+    admin_user: User = Depends(current_admin_user),
+):
+    """Copy the events of the source tournament, without solutions, by admin."""
+    if not await db.get(Tournament, tournament_id):
         raise HTTPException(status_code=404, detail="Tournament not found")
-    list_of_events = tournament.events
+    events = await clone_events(source_tournament_id, tournament_id, db)
+    if not events and not await db.get(Tournament, source_tournament_id):
+        raise HTTPException(status_code=404, detail="Source tournament not found")
+    return events
+
+
+@router.get("/tournaments/{tournament_id}/events", response_model=list[EventResponse])
+async def get_teams(  # noqa: F811
+    tournament_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Response all events of tournament, without users' answers."""
+
+    async def load():
+        tournament = await db.get(Tournament, tournament_id)
+        if not tournament:
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        result = await db.execute(
+            select(Event).where(Event.tournament_id == tournament_id)
+        )
+        return result.scalars().all()
+
+    return await cached_tournament_response(
+        request, tournament_id, "events", EVENTS_ADAPTER, load, db
+    )
+
 
-    return list_of_events
+@router.post(
+    "/tournaments/{tournament_id}/solutions",
+    response_model=list[EventResponse],
+    status_code=201,
+)
+async def set_solutions(
+    tournament_id: uuid.UUID,
+    solutions_data: BulkSolutionCreate,
+    db: AsyncSession = Depends(get_write_db),
+    admin_user: User = Depends(current_admin_user),
+):
+    """Sets the solutions of many events of a tournament at once by an admin."""
+    return await set_event_solutions_service(tournament_id, solutions_data, db)
 
 
 @router.post("/tournaments/{tournament_id}/finalize")
 async def finalize_tournament_endpoint(
     tournament_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    mode: FinalizeMode = FinalizeMode.PYTHON,
+    db: AsyncSession = Depends(get_write_db),
     admin_user: User = Depends(current_admin_user),
 ):
     """Finalize the tournament by checking all event answers and awarding points."""
-    return await finalize_tournament(tournament_id, db)
+    return await finalize_tournament(tournament_id, db, mode)
+
+
+@router.get(
+    "/tournaments/{tournament_id}/leaderboard",
+    response_model=list[LeaderboardEntryResponse],
+)
+async def get_tournament_leaderboard(
+    tournament_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Response the top entries of the tournament leaderboard."""
+    _, headers = await tournament_cache_headers(
+        tournament_id, PUBLIC_CACHE_HEADERS, db
+    )
+    if not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return await get_leaderboard(tournament_id, limit, db)
+
+
+@router.get(
+    "/tournaments/{tournament_id}/leaderboard/me",
+    response_model=list[LeaderboardEntryResponse],
+)
+async def get_my_tournament_leaderboard(
+    tournament_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    radius: int = Query(0, ge=0, le=10),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    user: User = Depends(current_active_user),
+):
+    """Response the user's leaderboard entry and entries ranked around it."""
+    _, headers = await tournament_cache_headers(
+        tournament_id, PRIVATE_CACHE_HEADERS, db
+    )
+    if not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return await get_leaderboard_around_user(tournament_id, user.id, radius, limit, db)
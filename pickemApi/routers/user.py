@@ -3,7 +3,12 @@
 from fastapi import APIRouter, Depends
 from pickemApi.models.model import User
 from pickemApi.core.security import auth_backend
-from pickemApi.models.usermanager import fastapi_users, current_active_user
+from pickemApi.core.user_cache import user_cache
+from pickemApi.models.usermanager import (
+    fastapi_users,
+    current_active_user,
+    current_admin_user,
+)
 from pickemApi.schemas.user import UserIn, UserResponse
 
 router = APIRouter()
@@ -32,3 +37,9 @@ router.include_router(
 @router.get("/authenticated-route")
 async def authenticated_route(user: User = Depends(current_active_user)):
     return {"message": f"Hello {user.email}!"}
+
+
+@router.get("/metrics/auth-cache", tags=["metrics"])
+async def auth_cache_metrics(user: User = Depends(current_admin_user)):
+    """Hit rate of the auth user cache and the time hits saved over queries."""
+    return user_cache.stats()
@@ -2,14 +2,27 @@
 Routers for managing answers of users APIs.
 """
 
+import uuid
 import logging
-import json
 from fastapi import Depends, APIRouter, HTTPException
-from pickemApi.schemas.events import UserAnswerCreate, UserAnswerResponse
+from pickemApi.schemas.events import (
+    UserAnswerCreate,
+    UserAnswerResponse,
+    BatchAnswerCreate,
+    BatchAnswerResult,
+)
+from pickemApi.models.enums import AnswerConflictMode
 from pickemApi.models.usermanager import current_active_user
-from pickemApi.core.database import AsyncSession, get_db
-from pickemApi.models.model import User, UserAnswer
-from sqlalchemy import select
+from pickemApi.core.config import config
+from pickemApi.core.database import AsyncSession, get_write_db
+from pickemApi.models.model import User
+from pickemApi.services.answer_buffer import answer_buffer
+from pickemApi.services.user_answer_service import (
+    answer_upsert_statement,
+    encode_answer,
+    raise_answer_not_stored,
+    submit_answers_batch,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -18,43 +31,62 @@ router = APIRouter()
 @router.post("/answers/", response_model=UserAnswerResponse, status_code=201)
 async def submit_answer(
     answer: UserAnswerCreate,
-    db: AsyncSession = Depends(get_db),
+    mode: AnswerConflictMode = AnswerConflictMode.REJECT,
+    db: AsyncSession = Depends(get_write_db),
     user: User = Depends(current_active_user),
 ):
-    """Submit user's answer to database."""
-    user_answer = (
-        json.dumps(answer.answer) if isinstance(answer.answer, list) else answer.answer
-    )
-
-    existing_answer = await db.execute(
-        select(UserAnswer).where(
-            UserAnswer.user_id == user.id,
-            UserAnswer.event_id == answer.event_id,
-        )
-    )
-    if existing_answer.scalar() is not None:
-        # If answer wxists raise excepetion.
-        logger.warning(
-            f"User {user.id} already submitted an answer for event {answer.event_id}."
-        )
-        raise HTTPException(
-            status_code=409,
-            detail="You have already submitted an answer for this event.",
-        )
+    """Submit user's answer to database.
+
+    A second answer for the same event is rejected, or replaces the first
+    one in `replace` mode. Events with a solution can no longer be answered.
+    """
+    row = {
+        "user_id": user.id,
+        "event_id": answer.event_id,
+        "answer": encode_answer(answer.answer),
+    }
 
-    new_answer = UserAnswer(
-        user_id=user.id,
-        event_id=answer.event_id,
-        answer=user_answer,
-    )
     logger.info("Adding user's answer to database.")
-    db.add(new_answer)
-    try:
-        await db.commit()
-        await db.refresh(new_answer)
-        logger.info("Succesfully addes answer to database.")
-    except Exception as e:
-        await db.rollback()
-        logger.error(f"Error adding answer: {e}")
+    if config.ANSWER_BUFFER_ENABLED:
+        new_answer = await answer_buffer.submit(row, mode)
+    else:
+        try:
+            new_answer = (
+                await db.scalars(
+                    answer_upsert_statement(db, [row], mode),
+                    execution_options={"populate_existing": True},
+                )
+            ).one_or_none()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Error adding answer: {e}")
+            raise HTTPException(status_code=400, detail="Could not submit answer")
 
+    if new_answer is None:
+        # If answer was not stored raise excepetion.
+        logger.warning(
+            f"Answer of user {user.id} for event {answer.event_id} was not stored."
+        )
+        await raise_answer_not_stored(answer.event_id, db)
+
+    logger.info("Succesfully addes answer to database.")
     return new_answer
+
+
+@router.post(
+    "/tournaments/{tournament_id}/answers/batch",
+    response_model=list[BatchAnswerResult],
+)
+async def submit_answers(
+    tournament_id: uuid.UUID,
+    batch: BatchAnswerCreate,
+    mode: AnswerConflictMode = AnswerConflictMode.REJECT,
+    db: AsyncSession = Depends(get_write_db),
+    user: User = Depends(current_active_user),
+):
+    """Submit all of user's answers for a tournament in one transaction.
+
+    Every pick gets its own result, so invalid or duplicate picks do not
+    prevent the others from being stored.
+    """
+    return await submit_answers_batch(tournament_id, user.id, batch, mode, db)
@@ -25,6 +25,17 @@ class TeamResponse(TeamBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TeamImportError(BaseModel):
+    line: int
+    detail: str
+
+
+class TeamImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TeamImportError]
+
+
 class TournamentBase(BaseModel):
     name: str
     date: date
@@ -34,6 +45,14 @@ class TournamentCreate(TournamentBase):
     pass
 
 
+class TournamentTeamsAdd(BaseModel):
+    team_ids: List[uuid.UUID]
+
+
+class TournamentTeamsResult(BaseModel):
+    added: int
+
+
 class TournamentResponse(TournamentBase):
     id: uuid.UUID
     teams: Optional[List[TeamResponse]]
@@ -58,6 +77,27 @@ class UserAnswerResponse(UserAnswerBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserAnswerPage(BaseModel):
+    answers: List[UserAnswerResponse]
+    next_after: Optional[uuid.UUID]
+
+
+class BatchAnswerItem(BaseModel):
+    event_id: uuid.UUID
+    answer: Union[str, List[str]]
+
+
+class BatchAnswerCreate(BaseModel):
+    answers: List[BatchAnswerItem]
+
+
+class BatchAnswerResult(BaseModel):
+    event_id: uuid.UUID
+    status_code: int
+    detail: Optional[str] = None
+    answer: Optional[UserAnswerResponse] = None
+
+
 class EventBase(BaseModel):
     tournament_id: uuid.UUID
     question_type: QuestionType
@@ -69,9 +109,18 @@ class EventCreate(EventBase):
     pass
 
 
+class EventTemplate(BaseModel):
+    question_type: QuestionType
+    question_text: str
+    points_value: int
+
+
+class EventBulkCreate(BaseModel):
+    events: List[EventTemplate]
+
+
 class EventResponse(EventBase):
     id: uuid.UUID
-    answers: Optional[List[UserAnswerResponse]]
     solution: Optional[Union[str, List[str]]]
 
     model_config = ConfigDict(from_attributes=True)
@@ -79,3 +128,19 @@ class EventResponse(EventBase):
 
 class EventSolutionCreate(BaseModel):
     solution: Union[str, List[str]]
+
+
+class EventSolutionItem(EventSolutionCreate):
+    event_id: uuid.UUID
+
+
+class BulkSolutionCreate(BaseModel):
+    solutions: List[EventSolutionItem]
+
+
+class LeaderboardEntryResponse(BaseModel):
+    user_id: uuid.UUID
+    points: int
+    rank: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,170 @@
+"""
+Group commit of answer submissions.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from pickemApi.core.config import config
+from pickemApi.core.database import async_session_maker
+from pickemApi.models.enums import AnswerConflictMode
+from pickemApi.models.model import UserAnswer
+from pickemApi.services.user_answer_service import answer_upsert_statement
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingAnswer:
+    row: dict
+    mode: AnswerConflictMode
+    future: asyncio.Future
+
+    @property
+    def key(self):
+        return self.row["user_id"], self.row["event_id"]
+
+
+class AnswerWriteBuffer:
+    """Collect answer submissions and write them with multi-row INSERTs.
+
+    Submissions are queued and flushed in one transaction every
+    `flush_interval` seconds or `max_rows` rows, whichever comes first.
+    `submit` returns once the row is committed, with the stored answer, or
+    None when a duplicate was rejected, exactly as a direct upsert would.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        flush_interval: float,
+        max_rows: int,
+    ):
+        self._session_maker = session_maker
+        self._flush_interval = flush_interval
+        self._max_rows = max_rows
+        self._queue = None
+        self._task = None
+        self._loop = None
+
+    async def submit(self, row: dict, mode: AnswerConflictMode) -> UserAnswer | None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        future = loop.create_future()
+        self._queue.put_nowait(_PendingAnswer(row, mode, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the writer task once it has flushed, then flush what is left.
+
+        The writer is stopped with a sentinel rather than cancelled, so a
+        flush in progress always commits and resolves its submissions.
+        """
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        pending = []
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            if entry is not None:
+                pending.append(entry)
+        if pending:
+            await self._flush(pending)
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = await self._queue.get()
+            if entry is None:
+                return
+            batch = [entry]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._max_rows:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    await self._flush(batch)
+                    return
+                batch.append(entry)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[_PendingAnswer]) -> None:
+        """Write the batch in one transaction, or each row alone if that fails.
+
+        Retrying row by row keeps one bad submission, such as an unknown
+        event, from failing the unrelated submissions it was batched with.
+        """
+        try:
+            stored = await self._write(batch)
+        except Exception as e:
+            if len(batch) > 1:
+                logger.warning(
+                    f"Flushing {len(batch)} buffered answers failed, "
+                    f"retrying them one by one: {e}"
+                )
+                for entry in batch:
+                    await self._flush([entry])
+                return
+            logger.error(f"Error flushing buffered answer: {e}")
+            error = HTTPException(status_code=400, detail="Could not submit answer")
+            if not batch[0].future.done():
+                batch[0].future.set_exception(error)
+            return
+
+        logger.info(f"Flushed {len(batch)} buffered answers.")
+        for entry in batch:
+            if not entry.future.done():
+                entry.future.set_result(stored.get(id(entry)))
+
+    async def _write(self, batch: list[_PendingAnswer]) -> dict:
+        """Upsert and commit the batch; return stored answers by entry id."""
+        stored = {}
+        async with self._session_maker() as db:
+            for wave in _waves(batch):
+                by_key = {entry.key: entry for entry in wave}
+                for mode in AnswerConflictMode:
+                    rows = [entry.row for entry in wave if entry.mode == mode]
+                    if not rows:
+                        continue
+                    answers = await db.scalars(
+                        answer_upsert_statement(db, rows, mode),
+                        execution_options={"populate_existing": True},
+                    )
+                    for answer in answers:
+                        stored[id(by_key[answer.user_id, answer.event_id])] = answer
+            await db.commit()
+        return stored
+
+
+def _waves(batch: list[_PendingAnswer]):
+    """Split a batch so no statement touches the same (user, event) twice."""
+    pending = batch
+    while pending:
+        wave, rest, seen = [], [], set()
+        for entry in pending:
+            if entry.key in seen:
+                rest.append(entry)
+            else:
+                seen.add(entry.key)
+                wave.append(entry)
+        yield wave
+        pending = rest
+
+
+answer_buffer = AnswerWriteBuffer(
+    async_session_maker,
+    flush_interval=config.ANSWER_BUFFER_FLUSH_MS / 1000,
+    max_rows=config.ANSWER_BUFFER_MAX_ROWS,
+)
@@ -6,8 +6,11 @@ import uuid
 import logging
 import json
 from fastapi import HTTPException
+from sqlalchemy.future import select
 from pickemApi.models.model import Event
-from pickemApi.schemas.events import EventSolutionCreate
+from pickemApi.schemas.events import BulkSolutionCreate, EventSolutionCreate
+from pickemApi.services.response_cache import bump_tournament_version
+from pickemApi.services.scoring import rescore_events
 from pickemApi.validators.event_validators import validate_event_solution_type
 from pickemApi.core.database import AsyncSession
 
@@ -41,8 +44,10 @@ async def set_event_solution_service(
 
     print(event.solution)
     try:
-        await db.commit()
-        await db.refresh(event)
+        # Score only this event's answers, applying point differences on corrections
+        await rescore_events([event], db)
+        await bump_tournament_version(event.tournament_id, db)
+        await db.flush()
         logger.info(f"Successfully set solution for event: {event.id}")
     except Exception as e:
         await db.rollback()
@@ -50,3 +55,60 @@ async def set_event_solution_service(
         raise HTTPException(status_code=400, detail="Could not set event solution")
 
     return event
+
+
+async def set_event_solutions_service(
+    tournament_id: uuid.UUID,
+    solutions_data: BulkSolutionCreate,
+    db: AsyncSession,
+):
+    """Set solutions of many events of a tournament and score them in one pass.
+
+    Every solution is validated before anything is written, so either all
+    solutions are stored or none.
+    """
+    logger.info(f"Setting {len(solutions_data.solutions)} solutions.")
+    event_ids = [item.event_id for item in solutions_data.solutions]
+    if len(set(event_ids)) != len(event_ids):
+        raise HTTPException(
+            status_code=422, detail="Event appears more than once in the solutions."
+        )
+
+    result = await db.execute(
+        select(Event).where(
+            Event.tournament_id == tournament_id, Event.id.in_(event_ids)
+        )
+    )
+    events = {event.id: event for event in result.scalars()}
+
+    for item in solutions_data.solutions:
+        event = events.get(item.event_id)
+        if not event:
+            raise HTTPException(
+                status_code=404, detail=f"Event {item.event_id} not found"
+            )
+        try:
+            validate_event_solution_type(item.solution, event.question_type)
+        except HTTPException as e:
+            raise HTTPException(
+                status_code=e.status_code, detail=f"Event {item.event_id}: {e.detail}"
+            )
+
+    for item in solutions_data.solutions:
+        solution = item.solution
+        events[item.event_id].solution = (
+            json.dumps(solution) if isinstance(solution, list) else solution
+        )
+
+    try:
+        # Score the answers of all events together
+        await rescore_events(list(events.values()), db)
+        await bump_tournament_version(tournament_id, db)
+        await db.flush()
+        logger.info(f"Successfully set solutions for tournament: {tournament_id}")
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error setting solutions for tournament {tournament_id}: {e}")
+        raise HTTPException(status_code=400, detail="Could not set event solutions")
+
+    return [events[event_id] for event_id in event_ids]
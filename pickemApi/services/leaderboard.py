@@ -0,0 +1,168 @@
+"""
+Materialized per-tournament leaderboards.
+"""
+
+import uuid
+import logging
+from fastapi import HTTPException
+from sqlalchemy import delete, func, insert, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from pickemApi.core.database import dialect_insert
+from pickemApi.models.model import Event, LeaderboardEntry, Tournament, UserAnswer
+from pickemApi.services.response_cache import bump_tournament_version
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_leaderboard(tournament_id: uuid.UUID, db: AsyncSession) -> None:
+    """Rebuild the stored leaderboard of a tournament from its answer points.
+
+    Every user with an answer in the tournament is ranked with a dense rank,
+    so tied users share a rank and the next rank follows without gaps.
+    """
+    totals = (
+        select(
+            Event.tournament_id.label("tournament_id"),
+            UserAnswer.user_id.label("user_id"),
+            func.sum(func.coalesce(UserAnswer.points, 0)).label("points"),
+        )
+        .join(Event, UserAnswer.event_id == Event.id)
+        .where(Event.tournament_id == tournament_id)
+        .group_by(Event.tournament_id, UserAnswer.user_id)
+        .subquery()
+    )
+    ranked = select(
+        totals.c.tournament_id,
+        totals.c.user_id,
+        totals.c.points,
+        func.dense_rank().over(order_by=totals.c.points.desc()),
+    )
+
+    await db.execute(
+        delete(LeaderboardEntry).where(LeaderboardEntry.tournament_id == tournament_id)
+    )
+    await db.execute(
+        insert(LeaderboardEntry).from_select(
+            ["tournament_id", "user_id", "points", "rank"], ranked
+        )
+    )
+    await bump_tournament_version(tournament_id, db)
+    logger.info(f"Refreshed leaderboard of tournament {tournament_id}.")
+
+
+async def rerank_leaderboard(tournament_id: uuid.UUID, db: AsyncSession) -> None:
+    """Recompute the dense ranks of a tournament from its stored entry points.
+
+    Only the leaderboard entries are read, one per ranked user, and only
+    entries whose rank moves are written.
+    """
+    ranked = (
+        select(
+            LeaderboardEntry.user_id.label("user_id"),
+            func.dense_rank()
+            .over(order_by=LeaderboardEntry.points.desc())
+            .label("rank"),
+        )
+        .where(LeaderboardEntry.tournament_id == tournament_id)
+        .subquery()
+    )
+    await db.execute(
+        update(LeaderboardEntry)
+        .where(
+            LeaderboardEntry.tournament_id == tournament_id,
+            LeaderboardEntry.user_id == ranked.c.user_id,
+            LeaderboardEntry.rank != ranked.c.rank,
+        )
+        .values(rank=ranked.c.rank),
+        execution_options={"synchronize_session": False},
+    )
+
+
+async def apply_leaderboard_deltas(deltas: list[dict], db: AsyncSession) -> None:
+    """Add point differences to stored leaderboards and re-rank them.
+
+    `deltas` holds one `tournament_id`, `user_id` and `points` mapping per
+    user who answered a rescored event, with 0 points for users whose total
+    did not change, so that every such user has an entry. Unlike
+    `refresh_leaderboard`, no answers are read.
+    """
+    if not deltas:
+        return
+
+    statement = dialect_insert(db, LeaderboardEntry)
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=["tournament_id", "user_id"],
+            set_={"points": LeaderboardEntry.points + statement.excluded.points},
+        ),
+        [{**delta, "rank": 0} for delta in deltas],
+    )
+    for tournament_id in {delta["tournament_id"] for delta in deltas}:
+        await rerank_leaderboard(tournament_id, db)
+        await bump_tournament_version(tournament_id, db)
+    logger.info(f"Applied {len(deltas)} leaderboard point changes.")
+
+
+async def get_leaderboard(
+    tournament_id: uuid.UUID, limit: int, db: AsyncSession
+) -> list[LeaderboardEntry]:
+    """Return the first `limit` entries of a tournament leaderboard.
+
+    The tournament is only looked up when the leaderboard is empty, to tell
+    a tournament nobody has answered yet from an unknown one.
+    """
+    result = await db.execute(
+        select(LeaderboardEntry)
+        .where(LeaderboardEntry.tournament_id == tournament_id)
+        .order_by(LeaderboardEntry.rank, LeaderboardEntry.user_id)
+        .limit(limit)
+    )
+    entries = result.scalars().all()
+    if not entries and not await db.get(Tournament, tournament_id):
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    return entries
+
+
+async def get_leaderboard_around_user(
+    tournament_id: uuid.UUID,
+    user_id: uuid.UUID,
+    radius: int,
+    limit: int,
+    db: AsyncSession,
+) -> list[LeaderboardEntry]:
+    """Return entries ranked within `radius` ranks of the user's own entry.
+
+    Entries are ordered by rank and user id. At most `limit` of them are
+    returned, the user's own entry with up to half of the rest before it.
+    Both sides are read by walking the rank index from the user's entry,
+    so tied ranks cost no more than `limit` rows.
+    """
+    entry = await db.get(LeaderboardEntry, (tournament_id, user_id))
+    if not entry:
+        raise HTTPException(status_code=404, detail="User is not on the leaderboard")
+
+    position = tuple_(LeaderboardEntry.rank, LeaderboardEntry.user_id)
+    mine = tuple_(entry.rank, entry.user_id)
+    in_range = (
+        LeaderboardEntry.tournament_id == tournament_id,
+        LeaderboardEntry.rank.between(entry.rank - radius, entry.rank + radius),
+    )
+    result = await db.execute(
+        select(LeaderboardEntry)
+        .where(*in_range, position < mine)
+        .order_by(LeaderboardEntry.rank.desc(), LeaderboardEntry.user_id.desc())
+        .limit(limit - 1)
+    )
+    before = result.scalars().all()
+    result = await db.execute(
+        select(LeaderboardEntry)
+        .where(*in_range, position >= mine)
+        .order_by(LeaderboardEntry.rank, LeaderboardEntry.user_id)
+        .limit(limit)
+    )
+    after = result.scalars().all()
+
+    # Split the limit evenly, giving a short side's unused share to the other
+    before = before[: max((limit - 1) // 2, limit - len(after))]
+    return before[::-1] + after[: limit - len(before)]
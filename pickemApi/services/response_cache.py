@@ -0,0 +1,97 @@
+"""
+Cache of serialized tournament responses, invalidated by tournament versions.
+"""
+
+import uuid
+import logging
+from collections import OrderedDict
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from pickemApi.core.config import config
+from pickemApi.core.database import dialect_insert
+from pickemApi.models.model import TournamentVersion
+
+
+logger = logging.getLogger(__name__)
+
+
+async def get_tournament_version(tournament_id: uuid.UUID, db: AsyncSession) -> int:
+    version = await db.scalar(
+        select(TournamentVersion.version).where(
+            TournamentVersion.tournament_id == tournament_id
+        )
+    )
+    return version or 0
+
+
+async def bump_tournament_version(tournament_id: uuid.UUID, db: AsyncSession) -> None:
+    """Mark the tournament's cached responses as stale.
+
+    Call it in the transaction of every write that changes what tournament
+    read endpoints return; the new version is visible once it commits.
+    """
+    statement = dialect_insert(db, TournamentVersion).values(
+        tournament_id=tournament_id, version=1
+    )
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=["tournament_id"],
+            set_={"version": TournamentVersion.version + 1},
+        )
+    )
+
+
+def tournament_etag(tournament_id: uuid.UUID, version: int) -> str:
+    """Strong entity tag of a tournament read route at a data version."""
+    return f'"{tournament_id}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header names `etag`, ignoring weak prefixes."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+class ResponseCache:
+    """LRU cache of response bodies bounded by their total size in bytes.
+
+    Each key holds the body for one tournament version; a lookup with any
+    other version misses, so bumping the version invalidates all workers.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: tuple, version: int) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: tuple, version: int, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        self.discard(key)
+        self._entries[key] = (version, body)
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def discard(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+response_cache = ResponseCache(config.RESPONSE_CACHE_MAX_BYTES)
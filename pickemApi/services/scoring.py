@@ -0,0 +1,147 @@
+"""
+Scoring of user answers against event solutions.
+"""
+
+import logging
+import numpy as np
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from pickemApi.models.model import Event, UserAnswer, User
+from pickemApi.services.leaderboard import apply_leaderboard_deltas
+from pickemApi.services.standings import bump_standings_version
+from pickemApi.validators.answer_check import AnswerCodes, score_answers
+
+logger = logging.getLogger(__name__)
+
+
+async def rescore_events(events: list[Event], db: AsyncSession) -> dict:
+    """Score all answers of the given events against their current solutions.
+
+    Only answers whose points change are written, and users receive the
+    difference between their new and old points, so scoring the same
+    events again is a no-op. Leaderboards of the events' tournaments move
+    by the same differences, and every user who answered gets an entry
+    even when none of their answers scored. Returns the points earned on
+    these events by every user with at least one correct answer.
+    """
+    if not events:
+        return {}
+
+    answers = (
+        await db.execute(
+            select(
+                UserAnswer.id,
+                UserAnswer.user_id,
+                UserAnswer.event_id,
+                UserAnswer.answer,
+                UserAnswer.points,
+            ).where(UserAnswer.event_id.in_([event.id for event in events]))
+        )
+    ).all()
+    if not answers:
+        return {}
+
+    codes = AnswerCodes()
+    event_positions = {event.id: i for i, event in enumerate(events)}
+    question_types = [event.question_type for event in events]
+    user_ids = list({answer.user_id: None for answer in answers})
+    user_positions = {user_id: i for i, user_id in enumerate(user_ids)}
+
+    event_index = np.fromiter(
+        (event_positions[answer.event_id] for answer in answers),
+        dtype=np.int64,
+        count=len(answers),
+    )
+    user_index = np.fromiter(
+        (user_positions[answer.user_id] for answer in answers),
+        dtype=np.int64,
+        count=len(answers),
+    )
+    answer_code = np.fromiter(
+        (
+            codes.encode(answer.answer, question_types[i])
+            for answer, i in zip(answers, event_index.tolist())
+        ),
+        dtype=np.int64,
+        count=len(answers),
+    )
+    old_points = np.fromiter(
+        (answer.points or 0 for answer in answers),
+        dtype=np.int64,
+        count=len(answers),
+    )
+    solution_code = np.array(
+        [codes.encode(event.solution, event.question_type) for event in events],
+        dtype=np.int64,
+    )
+    points_value = np.array([event.points_value for event in events], dtype=np.int64)
+
+    correct, points, user_points = score_answers(
+        event_index, user_index, answer_code, solution_code, points_value, len(user_ids)
+    )
+
+    delta = points - old_points
+    changed_rows = np.flatnonzero(delta).tolist()
+    if changed_rows:
+        answer_table = UserAnswer.__table__
+        await db.execute(
+            update(answer_table)
+            .where(answer_table.c.id == bindparam("answer_id"))
+            .values(points=bindparam("answer_points")),
+            [
+                {"answer_id": answers[row].id, "answer_points": int(points[row])}
+                for row in changed_rows
+            ],
+        )
+
+        user_delta = np.bincount(user_index, weights=delta, minlength=len(user_ids))
+        changed_users = np.flatnonzero(user_delta).tolist()
+        if changed_users:
+            version = await bump_standings_version(db)
+            user_table = User.__table__
+            await db.execute(
+                update(user_table)
+                .where(user_table.c.id == bindparam("user_id"))
+                .values(
+                    points=user_table.c.points + bindparam("delta"),
+                    points_version=version,
+                ),
+                [
+                    {"user_id": user_ids[i], "delta": int(user_delta[i])}
+                    for i in changed_users
+                ],
+            )
+        logger.info(f"Rescored {len(changed_rows)} answers.")
+
+    # Leaderboards move by the same deltas, summed per tournament and user
+    event_tournaments = [event.tournament_id for event in events]
+    tournament_positions = {
+        tournament_id: i for i, tournament_id in enumerate(set(event_tournaments))
+    }
+    tournament_ids = list(tournament_positions)
+    tournament_index = np.array(
+        [tournament_positions[tournament_id] for tournament_id in event_tournaments],
+        dtype=np.int64,
+    )[event_index]
+    keys, key_index = np.unique(
+        tournament_index * len(user_ids) + user_index, return_inverse=True
+    )
+    key_delta = np.bincount(key_index, weights=delta, minlength=len(keys))
+    await apply_leaderboard_deltas(
+        [
+            {
+                "tournament_id": tournament_ids[key // len(user_ids)],
+                "user_id": user_ids[key % len(user_ids)],
+                "points": int(points_delta),
+            }
+            for key, points_delta in zip(keys.tolist(), key_delta.tolist())
+        ],
+        db,
+    )
+
+    # Users with at least one correct answer are ranked, even for 0 points
+    scored_users = np.flatnonzero(
+        np.bincount(user_index, weights=correct, minlength=len(user_ids))
+    ).tolist()
+    return {user_ids[i]: int(user_points[i]) for i in scored_users}
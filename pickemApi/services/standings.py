@@ -0,0 +1,244 @@
+"""
+Global season standings over all users' points.
+"""
+
+import asyncio
+import logging
+import random
+import uuid
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from pickemApi.core.database import dialect_insert
+from pickemApi.models.model import StandingsState, User
+
+
+logger = logging.getLogger(__name__)
+
+STANDINGS_STATE_ID = 1
+
+
+class _Node:
+    __slots__ = ("key", "priority", "size", "left", "right")
+
+    def __init__(self, key):
+        self.key = key
+        self.priority = random.random()
+        self.size = 1
+        self.left = None
+        self.right = None
+
+
+def _size(node) -> int:
+    return node.size if node else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+
+def _split(node, key):
+    """Split into the nodes with keys lower than `key` and the rest."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        return _update(node), right
+    left, node.left = _split(node.left, key)
+    return left, _update(node)
+
+
+def _merge(left, right):
+    if left is None or right is None:
+        return left or right
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+
+class RankTree:
+    """Order-statistic treap with O(log n) insert, remove, rank and select."""
+
+    def __init__(self):
+        self._root = None
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def insert(self, key) -> None:
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key)), right)
+
+    def remove(self, key) -> None:
+        left, right = _split(self._root, key)
+        _, right = _split(right, (key[0], key[1] + "\0"))
+        self._root = _merge(left, right)
+
+    def count_lower(self, key) -> int:
+        """Return the number of keys lower than `key`."""
+        node, count = self._root, 0
+        while node:
+            if node.key < key:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def select(self, index: int):
+        """Return the key at position `index` in ascending order."""
+        node = self._root
+        while node:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.key
+            else:
+                index -= left_size + 1
+                node = node.right
+        raise IndexError(index)
+
+
+class GlobalStandings:
+    """Users ranked by their total points, kept in sync with the database.
+
+    Every change of `User.points` stamps the changed users with a new
+    standings version. Each worker process keeps its own tree and, before
+    answering, applies the users stamped after the version it last saw, so
+    all workers agree with the database at the cost of one primary key read.
+    A lower version than the last one seen comes from a lagging replica and
+    is skipped. Ranks are dense like tournament leaderboards: users with
+    equal points share a rank and the next rank follows without gaps. Users
+    without points are not stored; their rank follows every scorer.
+    """
+
+    def __init__(self):
+        self._tree = RankTree()
+        self._scores = RankTree()
+        self._points = {}
+        self._score_counts = {}
+        self._version = None
+        self._lock = asyncio.Lock()
+
+    async def load(self, db: AsyncSession) -> None:
+        """Rebuild the standings from every user's points."""
+        async with self._lock:
+            await self._load(db, await get_standings_version(db))
+
+    async def sync(self, db: AsyncSession) -> None:
+        """Apply point changes committed since the last load or sync.
+
+        The version is read before taking the lock, so requests only wait
+        for each other while there are changes to apply.
+        """
+        version = await get_standings_version(db)
+        if self._version is not None and version <= self._version:
+            return
+        async with self._lock:
+            if self._version is None:
+                await self._load(db, version)
+            elif version > self._version:
+                result = await db.execute(
+                    select(User.id, User.points).where(
+                        User.points_version > self._version
+                    )
+                )
+                for user_id, points in result:
+                    self._set(user_id, points)
+                self._version = version
+
+    async def _load(self, db: AsyncSession, version: int) -> None:
+        result = await db.execute(select(User.id, User.points).where(User.points > 0))
+        self._tree = RankTree()
+        self._scores = RankTree()
+        self._points = {}
+        self._score_counts = {}
+        for user_id, points in result:
+            self._set(user_id, points)
+        self._version = version
+        logger.info(f"Loaded standings of {len(self._points)} users.")
+
+    def _set(self, user_id: uuid.UUID, points: int) -> None:
+        old_points = self._points.pop(user_id, None)
+        if old_points is not None:
+            self._tree.remove((-old_points, str(user_id)))
+            self._score_counts[old_points] -= 1
+            if not self._score_counts[old_points]:
+                del self._score_counts[old_points]
+                self._scores.remove((-old_points, ""))
+        if points and points > 0:
+            self._points[user_id] = points
+            self._tree.insert((-points, str(user_id)))
+            if points not in self._score_counts:
+                self._score_counts[points] = 0
+                self._scores.insert((-points, ""))
+            self._score_counts[points] += 1
+
+    def _rank(self, points: int) -> int:
+        """Return the dense rank of `points`: one more than the higher scores."""
+        return self._scores.count_lower((-points, "")) + 1
+
+    def _entry(self, key) -> dict:
+        negative_points, user_id = key
+        return {
+            "user_id": uuid.UUID(user_id),
+            "points": -negative_points,
+            "rank": self._rank(-negative_points),
+        }
+
+    async def rank_of(self, user_id: uuid.UUID, db: AsyncSession) -> dict:
+        """Return the user's points and rank; equal points share a rank."""
+        await self.sync(db)
+        points = self._points.get(user_id, 0)
+        return {
+            "user_id": user_id,
+            "points": points,
+            "rank": self._rank(points),
+        }
+
+    async def page(self, start_rank: int, limit: int, db: AsyncSession) -> list[dict]:
+        """Return up to `limit` users starting with the first one at `start_rank`.
+
+        The dense rank is turned into a position in the tree by finding the
+        points of that rank among the distinct scores, both in O(log n).
+        """
+        await self.sync(db)
+        if start_rank > len(self._scores):
+            return []
+        negative_points, _ = self._scores.select(start_rank - 1)
+        start = self._tree.count_lower((negative_points, ""))
+        end = min(start + limit, len(self._tree))
+        return [self._entry(self._tree.select(index)) for index in range(start, end)]
+
+
+global_standings = GlobalStandings()
+
+
+async def get_standings_version(db: AsyncSession) -> int:
+    version = await db.scalar(
+        select(StandingsState.version).where(StandingsState.id == STANDINGS_STATE_ID)
+    )
+    return version or 0
+
+
+async def bump_standings_version(db: AsyncSession) -> int:
+    """Return a new standings version to stamp users whose points change.
+
+    The counter row stays locked until the transaction ends, so versions
+    become visible to readers in increasing order.
+    """
+    await db.execute(
+        dialect_insert(db, StandingsState)
+        .values(id=STANDINGS_STATE_ID, version=0)
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    return await db.scalar(
+        update(StandingsState)
+        .where(StandingsState.id == STANDINGS_STATE_ID)
+        .values(version=StandingsState.version + 1)
+        .returning(StandingsState.version)
+    )
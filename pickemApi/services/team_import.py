@@ -0,0 +1,128 @@
+"""
+Streaming import of teams from CSV or NDJSON uploads.
+"""
+
+import codecs
+import csv
+import json
+import logging
+from typing import AsyncIterator, Optional
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert
+from pickemApi.core.database import AsyncSession
+from pickemApi.models.model import Team
+from pickemApi.schemas.events import TeamCreate, TeamImportError, TeamImportResult
+
+logger = logging.getLogger(__name__)
+
+CSV_TYPES = {"text/csv"}
+NDJSON_TYPES = {"application/x-ndjson", "application/jsonl", "application/json-lines"}
+
+IMPORT_CHUNK_ROWS = 500
+MAX_LINE_LENGTH = 64 * 1024
+MAX_REPORTED_ERRORS = 1000
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, Optional[str]]]:
+    """Split a byte stream into numbered UTF-8 lines without reading it whole.
+
+    A leading byte order mark, as written by spreadsheet exports, is dropped.
+    Lines longer than `MAX_LINE_LENGTH` characters are yielded as `None`
+    once their end is reached, so a single huge line cannot exhaust memory.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    too_long = False
+    line_number = 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, None if too_long else line.rstrip("\r")
+            too_long = False
+        if len(buffer) > MAX_LINE_LENGTH:
+            buffer = ""
+            too_long = True
+    buffer += decoder.decode(b"", final=True)
+    if buffer or too_long:
+        yield line_number + 1, None if too_long else buffer.rstrip("\r")
+
+
+def _parse_ndjson(line: str) -> dict:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e.msg}")
+    if not isinstance(record, dict):
+        raise ValueError("Line must be a JSON object.")
+    return record
+
+
+async def import_teams(
+    content_type: str, chunks: AsyncIterator[bytes], db: AsyncSession
+) -> TeamImportResult:
+    """Validate every line as a `TeamCreate` and insert valid teams in chunks.
+
+    CSV uploads start with a header naming the `player_1` and `player_2`
+    columns; NDJSON uploads hold one JSON object per line. Blank lines are
+    skipped. Invalid lines are reported and do not stop the import.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type not in CSV_TYPES | NDJSON_TYPES:
+        raise HTTPException(
+            status_code=415, detail="Upload must be text/csv or application/x-ndjson"
+        )
+
+    result = TeamImportResult(imported=0, failed=0, errors=[])
+    header = None
+    rows = []
+
+    def fail(line_number: int, detail: str) -> None:
+        result.failed += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(TeamImportError(line=line_number, detail=detail))
+
+    async for line_number, line in iter_lines(chunks):
+        if line is None:
+            fail(line_number, f"Line is longer than {MAX_LINE_LENGTH} characters.")
+            continue
+        if not line.strip():
+            continue
+        try:
+            if media_type in NDJSON_TYPES:
+                record = _parse_ndjson(line)
+            elif header is None:
+                header = [name.strip() for name in next(csv.reader([line]))]
+                if not {"player_1", "player_2"} <= set(header):
+                    raise HTTPException(
+                        status_code=422,
+                        detail="CSV header must name player_1 and player_2 columns",
+                    )
+                continue
+            else:
+                record = dict(zip(header, next(csv.reader([line]))))
+            team = TeamCreate.model_validate(record)
+        except ValidationError as e:
+            errors = (f"{error['loc'][0]}: {error['msg']}" for error in e.errors())
+            fail(line_number, "; ".join(errors))
+            continue
+        except ValueError as e:
+            fail(line_number, str(e))
+            continue
+
+        rows.append(team.model_dump())
+        if len(rows) >= IMPORT_CHUNK_ROWS:
+            await db.execute(insert(Team), rows)
+            result.imported += len(rows)
+            rows = []
+
+    if rows:
+        await db.execute(insert(Team), rows)
+        result.imported += len(rows)
+
+    logger.info(f"Imported {result.imported} teams, {result.failed} lines failed.")
+    return result
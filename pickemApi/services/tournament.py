@@ -4,17 +4,204 @@ Logic of tournament API.
 
 import uuid
 import logging
+from sqlalchemy import and_, case, func, insert, literal, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from pickemApi.models.model import Event, UserAnswer, User
-from pickemApi.validators.answer_check import check_answer
+from pickemApi.core.database import dialect_insert, dialect_random_uuid
+from pickemApi.models.enums import FinalizeMode, QuestionType
+from pickemApi.schemas.events import EventTemplate
+from pickemApi.models.model import (
+    Event,
+    Team,
+    Tournament,
+    UserAnswer,
+    User,
+    tournament_teams,
+)
+from pickemApi.services.leaderboard import refresh_leaderboard
+from pickemApi.services.response_cache import bump_tournament_version
+from pickemApi.services.scoring import rescore_events
+from pickemApi.services.standings import bump_standings_version
 from fastapi import HTTPException
 
-
 logger = logging.getLogger(__name__)
 
 
-async def finalize_tournament(tournament_id: uuid.UUID, db: AsyncSession):
+def answer_is_correct():
+    """SQL predicate equivalent to `check_answer` on stored answers and solutions.
+
+    Multiple choice answers are stored as JSON text whose choices may be in
+    any order, which text comparison cannot match, so they are left out and
+    scored by `rescore_events` instead.
+    """
+    return or_(
+        and_(
+            Event.question_type == QuestionType.YES_NO,
+            func.lower(UserAnswer.answer) == func.lower(Event.solution),
+        ),
+        and_(
+            Event.question_type == QuestionType.SINGLE_CHOICE,
+            UserAnswer.answer == Event.solution,
+        ),
+    )
+
+
+async def _score_answers_sql(
+    tournament_id: uuid.UUID, events: list[Event], db: AsyncSession
+) -> dict:
+    """Score answers with set-based statements and return points per user.
+
+    Like `rescore_events`, only answers whose points change are written and
+    users receive the difference, so finalizing again is a no-op. Multiple
+    choice events are scored by `rescore_events`, which decodes the choices.
+    """
+    in_tournament = and_(
+        UserAnswer.event_id == Event.id,
+        Event.tournament_id == tournament_id,
+        Event.question_type != QuestionType.MULTIPLE_CHOICE,
+    )
+    new_points = case((answer_is_correct(), Event.points_value), else_=0)
+    old_points = func.coalesce(UserAnswer.points, 0)
+
+    totals = (
+        select(
+            UserAnswer.user_id.label("user_id"),
+            func.sum(Event.points_value).label("points"),
+        )
+        .where(in_tournament, answer_is_correct())
+        .group_by(UserAnswer.user_id)
+    )
+    user_points = {row.user_id: row.points for row in await db.execute(totals)}
+
+    deltas = (
+        select(
+            UserAnswer.user_id.label("user_id"),
+            func.sum(new_points - old_points).label("delta"),
+        )
+        .where(in_tournament, new_points != old_points)
+        .group_by(UserAnswer.user_id)
+        .subquery()
+    )
+    version = await bump_standings_version(db)
+    await db.execute(
+        update(User)
+        .where(User.id == deltas.c.user_id)
+        .values(points=User.points + deltas.c.delta, points_version=version),
+        execution_options={"synchronize_session": False},
+    )
+
+    await db.execute(
+        update(UserAnswer)
+        .where(in_tournament, new_points != old_points)
+        .values(points=new_points),
+        execution_options={"synchronize_session": False},
+    )
+
+    # Rebuilt before scoring choice events, which apply their own deltas to it
+    await refresh_leaderboard(tournament_id, db)
+    choice_events = [
+        event for event in events if event.question_type == QuestionType.MULTIPLE_CHOICE
+    ]
+    if choice_events:
+        for user_id, points in (await rescore_events(choice_events, db)).items():
+            user_points[user_id] = user_points.get(user_id, 0) + points
+
+    return user_points
+
+
+TEAM_IDS_PER_STATEMENT = 10000
+
+
+async def add_teams_to_tournament(
+    tournament_id: uuid.UUID, team_ids: list[uuid.UUID], db: AsyncSession
+) -> int:
+    """Assign existing teams to the tournament and return how many were added.
+
+    Rows are inserted with INSERT ... SELECT from the teams table, so unknown
+    ids and teams already in the tournament are skipped without loading any
+    objects. Very long id lists are split to respect driver parameter limits.
+    """
+    added = 0
+    unique_ids = list(dict.fromkeys(team_ids))
+    for start in range(0, len(unique_ids), TEAM_IDS_PER_STATEMENT):
+        chunk = unique_ids[start : start + TEAM_IDS_PER_STATEMENT]
+        statement = (
+            dialect_insert(db, tournament_teams)
+            .from_select(
+                ["tournament_id", "team_id"],
+                select(literal(tournament_id, Tournament.id.type), Team.id).where(
+                    Team.id.in_(chunk)
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["tournament_id", "team_id"])
+        )
+        added += (await db.execute(statement)).rowcount
+    if added:
+        await bump_tournament_version(tournament_id, db)
+    logger.info(f"Added {added} teams to tournament {tournament_id}.")
+    return added
+
+
+async def create_events(
+    tournament_id: uuid.UUID, templates: list[EventTemplate], db: AsyncSession
+) -> list[Event]:
+    """Insert all events of the tournament in one multi-row INSERT ... RETURNING."""
+    for i, template in enumerate(templates):
+        if template.points_value < 0:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Event {i}: Points value must be non-negative",
+            )
+    if not templates:
+        return []
+
+    rows = [
+        {"tournament_id": tournament_id, **template.model_dump()}
+        for template in templates
+    ]
+    events = (await db.scalars(insert(Event).returning(Event), rows)).all()
+    await bump_tournament_version(tournament_id, db)
+    logger.info(f"Created {len(events)} events for tournament {tournament_id}.")
+    return events
+
+
+async def clone_events(
+    source_tournament_id: uuid.UUID, tournament_id: uuid.UUID, db: AsyncSession
+) -> list[Event]:
+    """Copy the questions of another tournament's events in one INSERT ... SELECT.
+
+    Solutions are not copied, so the cloned events are ready to be answered.
+    """
+    source = select(
+        dialect_random_uuid(db),
+        literal(tournament_id, Event.tournament_id.type),
+        Event.question_type,
+        Event.question_text,
+        Event.points_value,
+    ).where(Event.tournament_id == source_tournament_id)
+    statement = (
+        insert(Event)
+        .from_select(
+            ["id", "tournament_id", "question_type", "question_text", "points_value"],
+            source,
+        )
+        .returning(Event)
+    )
+    events = (await db.scalars(statement)).all()
+    if events:
+        await bump_tournament_version(tournament_id, db)
+    logger.info(
+        f"Cloned {len(events)} events from tournament {source_tournament_id} "
+        f"to {tournament_id}."
+    )
+    return events
+
+
+async def finalize_tournament(
+    tournament_id: uuid.UUID,
+    db: AsyncSession,
+    mode: FinalizeMode = FinalizeMode.PYTHON,
+):
     try:
         # Fetch all events for the tournament
         tournament_events = await db.execute(
@@ -27,35 +214,13 @@ async def finalize_tournament(tournament_id: uuid.UUID, db: AsyncSession):
                 status_code=404, detail="No events found for this tournament"
             )
 
-        # Fetch all user answers for the events
-        user_answers = await db.execute(
-            select(UserAnswer).where(
-                UserAnswer.event_id.in_([event.id for event in events])
-            )
-        )
-        answers = user_answers.scalars().all()
-
-        # Create a dictionary to hold user points
-        user_points = {}
-
-        for answer in answers:
-            event = next((e for e in events if e.id == answer.event_id), None)
-            if event:
-                if check_answer(answer.answer, event.solution, event.question_type):
-                    # Add points for the user
-                    user_points[answer.user_id] = (
-                        user_points.get(answer.user_id, 0) + event.points_value
-                    )
-                    answer.points = event.points_value  # Update points in user answer
-
-        # Update user points in the User table
-        for user_id, points in user_points.items():
-            user = await db.get(User, user_id)
-            if user:
-                user.points += points  # Accumulate points for the user
-
-        # Commit all changes
-        await db.commit()
+        if mode == FinalizeMode.SQL:
+            user_points = await _score_answers_sql(tournament_id, events, db)
+        else:
+            user_points = await rescore_events(events, db)
+
+        # Flush all changes; the caller's session dependency commits them
+        await db.flush()
 
         # Prepare the ranking
         ranking = {
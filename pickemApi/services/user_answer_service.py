@@ -0,0 +1,162 @@
+"""
+The business logic for user answers.
+"""
+
+import uuid
+import json
+import logging
+from fastapi import HTTPException
+from sqlalchemy import literal, union_all
+from sqlalchemy.future import select
+from pickemApi.core.database import AsyncSession, dialect_insert
+from pickemApi.models.enums import AnswerConflictMode
+from pickemApi.models.model import Event, UserAnswer
+from pickemApi.schemas.events import (
+    BatchAnswerCreate,
+    BatchAnswerResult,
+    UserAnswerResponse,
+)
+from pickemApi.validators.event_validators import validate_answer_type
+
+logger = logging.getLogger(__name__)
+
+
+def encode_answer(answer):
+    """Store answers as JSON if they are a list, otherwise as a string."""
+    return json.dumps(answer) if isinstance(answer, list) else answer
+
+
+def answer_upsert_statement(db: AsyncSession, rows: list[dict], mode: AnswerConflictMode):
+    """Return an INSERT of answer rows that resolves duplicates according to `mode`.
+
+    Answers are only stored while their event has no solution, since the
+    event has been scored by then: each row is selected from its event with
+    the solution still empty, so rows of solved or unknown events are not
+    inserted. Rows that conflict with a stored answer are skipped in reject
+    mode, and replace the stored answer in replace mode while the event has
+    no solution. Skipped rows are not returned by the statement.
+    """
+    source = union_all(
+        *(
+            select(
+                literal(uuid.uuid4(), UserAnswer.id.type),
+                literal(row["user_id"], UserAnswer.user_id.type),
+                Event.id,
+                literal(row["answer"], UserAnswer.answer.type),
+                literal(0, UserAnswer.points.type),
+            ).where(Event.id == row["event_id"], Event.solution.is_(None))
+            for row in rows
+        )
+    )
+    statement = dialect_insert(db, UserAnswer).from_select(
+        ["id", "user_id", "event_id", "answer", "points"], source
+    )
+    if mode == AnswerConflictMode.REPLACE:
+        solved_events = select(Event.id).where(Event.solution.is_not(None))
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "event_id"],
+            set_={"answer": statement.excluded.answer},
+            where=UserAnswer.event_id.not_in(solved_events),
+        )
+    else:
+        statement = statement.on_conflict_do_nothing(
+            index_elements=["user_id", "event_id"]
+        )
+    return statement.returning(UserAnswer)
+
+
+SOLVED_EVENT_DETAIL = "The event has a solution, so it can no longer be answered."
+DUPLICATE_ANSWER_DETAIL = "You have already submitted an answer for this event."
+
+
+async def raise_answer_not_stored(event_id: uuid.UUID, db: AsyncSession):
+    """Raise the error of an answer skipped by `answer_upsert_statement`.
+
+    Only runs once an answer was not stored, to tell an unknown event, an
+    event with a solution and a duplicate answer apart.
+    """
+    event = (
+        await db.execute(select(Event.id, Event.solution).where(Event.id == event_id))
+    ).one_or_none()
+    if event is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if event.solution is not None:
+        raise HTTPException(status_code=409, detail=SOLVED_EVENT_DETAIL)
+    raise HTTPException(status_code=409, detail=DUPLICATE_ANSWER_DETAIL)
+
+
+async def submit_answers_batch(
+    tournament_id: uuid.UUID,
+    user_id: uuid.UUID,
+    batch: BatchAnswerCreate,
+    mode: AnswerConflictMode,
+    db: AsyncSession,
+) -> list[BatchAnswerResult]:
+    """Validate and store all of a user's picks for a tournament at once.
+
+    Returns one result per submitted pick, in order, so that invalid picks
+    do not prevent the valid ones from being stored.
+    """
+    event_ids = {item.event_id for item in batch.answers}
+    events = {
+        event.id: event
+        for event in await db.execute(
+            select(Event.id, Event.question_type, Event.solution).where(
+                Event.tournament_id == tournament_id, Event.id.in_(event_ids)
+            )
+        )
+    }
+
+    results = []
+    rows = {}
+    for item in batch.answers:
+        result = BatchAnswerResult(event_id=item.event_id, status_code=201)
+        results.append(result)
+        if item.event_id not in events:
+            result.status_code = 404
+            result.detail = "Event not found in this tournament"
+            continue
+        if events[item.event_id].solution is not None:
+            result.status_code = 409
+            result.detail = SOLVED_EVENT_DETAIL
+            continue
+        if item.event_id in rows:
+            result.status_code = 422
+            result.detail = "Event appears more than once in the batch."
+            continue
+        try:
+            validate_answer_type(item.answer, events[item.event_id].question_type)
+        except HTTPException as e:
+            result.status_code = e.status_code
+            result.detail = e.detail
+            continue
+        rows[item.event_id] = {
+            "user_id": user_id,
+            "event_id": item.event_id,
+            "answer": encode_answer(item.answer),
+        }
+
+    stored = {}
+    if rows:
+        try:
+            answers = await db.scalars(
+                answer_upsert_statement(db, list(rows.values()), mode),
+                execution_options={"populate_existing": True},
+            )
+            stored = {answer.event_id: answer for answer in answers}
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Error adding answers for tournament {tournament_id}: {e}")
+            raise HTTPException(status_code=400, detail="Could not submit answers")
+        logger.info(f"Stored {len(stored)} answers of user {user_id}.")
+
+    for result in results:
+        if result.status_code != 201:
+            continue
+        if result.event_id in stored:
+            result.answer = UserAnswerResponse.model_validate(stored[result.event_id])
+        else:
+            result.status_code = 409
+            result.detail = DUPLICATE_ANSWER_DETAIL
+
+    return results
@@ -12,13 +12,14 @@ from httpx import AsyncClient, ASGITransport
 from datetime import date
 
 from fastapi_users.password import PasswordHelper
+from sqlalchemy import event
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 
 
 os.environ["ENV_STATE"] = "testing"  # noqa E402
 from pickemApi.main import app
-from pickemApi.core.database import engine, get_db
+from pickemApi.core.database import engine, get_write_db
 from pickemApi.models.model import Base, User, Tournament, Event, QuestionType
 from pickemApi.models.usermanager import get_user_manager
 
@@ -26,7 +27,7 @@ from pickemApi.models.usermanager import get_user_manager
 password_hash = PasswordHash((Argon2Hasher(),))
 password_helper = PasswordHelper(password_hash)
 
-get_async_session_context = contextlib.asynccontextmanager(get_db)
+get_async_session_context = contextlib.asynccontextmanager(get_write_db)
 get_user_manager_context = contextlib.asynccontextmanager(get_user_manager)
 
 
@@ -45,6 +46,28 @@ async def db_setup():
         await conn.run_sync(Base.metadata.drop_all)  # Usuwanie tabel
 
 
+@pytest.fixture
+def count_queries():
+    """Collect SQL statements emitted inside `with count_queries() as statements`."""
+
+    @contextlib.contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(
+                engine.sync_engine, "before_cursor_execute", before_cursor_execute
+            )
+
+    return counter
+
+
 @pytest.fixture
 async def async_client(db_setup) -> AsyncGenerator:
     """Asynchronous HTTP client for testing."""
@@ -0,0 +1,43 @@
+"""
+Tests for events APIs.
+"""
+
+import uuid
+import pytest
+from httpx import AsyncClient
+
+from pickemApi.models.model import Event, UserAnswer
+
+
+@pytest.mark.anyio
+async def test_get_event_answers_pages(
+    async_client: AsyncClient, created_event: Event, db_session
+):
+    answers = [
+        UserAnswer(user_id=uuid.uuid4(), event_id=created_event.id, answer=str(i))
+        for i in range(5)
+    ]
+    db_session.add_all(answers)
+    await db_session.commit()
+
+    seen = []
+    after = None
+    for _ in range(3):
+        params = {"limit": 2, **({"after": after} if after else {})}
+        response = await async_client.get(
+            f"/events/{created_event.id}/answers", params=params
+        )
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(answer["id"] for answer in page["answers"])
+        after = page["next_after"]
+
+    assert after is None
+    assert seen == sorted(str(answer.id) for answer in answers)
+
+
+@pytest.mark.anyio
+async def test_get_event_answers_event_not_found(async_client: AsyncClient):
+    response = await async_client.get(f"/events/{uuid.uuid4()}/answers")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Event not found"
@@ -0,0 +1,214 @@
+"""
+Tests for tournament leaderboard APIs.
+"""
+
+import uuid
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.future import select
+
+from pickemApi.models.model import Event, QuestionType, Tournament, UserAnswer
+from pickemApi.schemas.events import EventSolutionCreate
+from pickemApi.services.event_solution_service import set_event_solution_service
+
+
+async def score_tournament(db_session, tournament: Tournament, answers: dict):
+    """Answer two events for every user and set their solutions."""
+    events = [
+        Event(
+            tournament_id=tournament.id,
+            question_type=QuestionType.SINGLE_CHOICE,
+            question_text=f"Question {i}",
+            points_value=10,
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(events)
+    await db_session.flush()
+    db_session.add_all(
+        UserAnswer(user_id=user_id, event_id=event.id, answer=answer)
+        for user_id, user_answers in answers.items()
+        for event, answer in zip(events, user_answers)
+    )
+    await db_session.commit()
+
+    for event in events:
+        await set_event_solution_service(
+            event.id, EventSolutionCreate(solution="A"), db_session
+        )
+    await db_session.commit()
+
+
+@pytest.mark.anyio
+async def test_leaderboard_dense_ranks(
+    authorized_client: AsyncClient, created_tournament: Tournament, db_session
+):
+    me = uuid.UUID(authorized_client.user_id)
+    others = [uuid.uuid4() for _ in range(3)]
+    await score_tournament(
+        db_session,
+        created_tournament,
+        {
+            others[0]: ["A", "A"],
+            others[1]: ["A", "A"],
+            me: ["A", "B"],
+            others[2]: ["B", "B"],
+        },
+    )
+
+    response = await authorized_client.get(
+        f"/tournaments/{created_tournament.id}/leaderboard", params={"limit": 3}
+    )
+    assert response.status_code == 200
+    entries = response.json()
+    assert [(entry["rank"], entry["points"]) for entry in entries] == [
+        (1, 20),
+        (1, 20),
+        (2, 10),
+    ]
+    assert entries[2]["user_id"] == str(me)
+
+    response = await authorized_client.get(
+        f"/tournaments/{created_tournament.id}/leaderboard/me", params={"radius": 1}
+    )
+    assert response.status_code == 200
+    assert [entry["rank"] for entry in response.json()] == [1, 1, 2, 3]
+
+    response = await authorized_client.get(
+        f"/tournaments/{created_tournament.id}/leaderboard/me"
+    )
+    assert response.json() == [{"user_id": str(me), "points": 10, "rank": 2}]
+
+
+@pytest.mark.anyio
+async def test_leaderboard_me_limits_tied_users(
+    authorized_client: AsyncClient, created_tournament: Tournament, db_session
+):
+    me = uuid.UUID(authorized_client.user_id)
+    tied = sorted([me, *(uuid.uuid4() for _ in range(6))])
+    await score_tournament(
+        db_session, created_tournament, {user_id: ["A", "B"] for user_id in tied}
+    )
+
+    response = await authorized_client.get(
+        f"/tournaments/{created_tournament.id}/leaderboard/me", params={"limit": 3}
+    )
+    assert response.status_code == 200
+    entries = response.json()
+    assert [entry["rank"] for entry in entries] == [1, 1, 1]
+    position = tied.index(me)
+    start = min(max(position - 1, 0), len(tied) - 3)
+    assert [entry["user_id"] for entry in entries] == [
+        str(user_id) for user_id in tied[start : start + 3]
+    ]
+
+
+@pytest.mark.anyio
+async def test_leaderboard_follows_changed_solutions(
+    authorized_client: AsyncClient, created_tournament: Tournament, db_session
+):
+    me = uuid.UUID(authorized_client.user_id)
+    other = uuid.uuid4()
+    await score_tournament(
+        db_session, created_tournament, {me: ["A", "B"], other: ["B", "B"]}
+    )
+    event_ids = (
+        await db_session.execute(
+            select(Event.id).where(Event.tournament_id == created_tournament.id)
+        )
+    ).scalars()
+    for event_id in event_ids:
+        await set_event_solution_service(
+            event_id, EventSolutionCreate(solution="B"), db_session
+        )
+    await db_session.commit()
+
+    response = await authorized_client.get(
+        f"/tournaments/{created_tournament.id}/leaderboard"
+    )
+    assert [
+        (entry["user_id"], entry["points"], entry["rank"]) for entry in response.json()
+    ] == [
+        (str(other), 20, 1),
+        (str(me), 10, 2),
+    ]
+
+
+@pytest.mark.anyio
+async def test_leaderboard_me_not_ranked(
+    authorized_client: AsyncClient, created_tournament: Tournament
+):
+    response = await authorized_client.get(
+        f"/tournaments/{created_tournament.id}/leaderboard/me"
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User is not on the leaderboard"
+
+
+@pytest.mark.anyio
+async def test_leaderboard_ranks_users_without_points(
+    authorized_client: AsyncClient, created_tournament: Tournament, db_session
+):
+    me = uuid.UUID(authorized_client.user_id)
+    await score_tournament(db_session, created_tournament, {me: ["B", "B"]})
+
+    response = await authorized_client.get(
+        f"/tournaments/{created_tournament.id}/leaderboard/me"
+    )
+    assert response.status_code == 200
+    assert response.json() == [{"user_id": str(me), "points": 0, "rank": 1}]
+
+
+@pytest.mark.anyio
+async def test_leaderboard_unknown_tournament(authorized_client: AsyncClient):
+    response = await authorized_client.get(f"/tournaments/{uuid.uuid4()}/leaderboard")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Tournament not found"
+
+
+@pytest.mark.anyio
+async def test_leaderboard_conditional_requests(
+    authorized_client: AsyncClient,
+    created_tournament: Tournament,
+    db_session,
+    count_queries,
+):
+    url = f"/tournaments/{created_tournament.id}/leaderboard"
+    await score_tournament(db_session, created_tournament, {uuid.uuid4(): ["A", "A"]})
+
+    response = await authorized_client.get(url)
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, no-cache"
+
+    with count_queries() as statements:
+        response = await authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert len(statements) == 1
+
+    await score_tournament(db_session, created_tournament, {uuid.uuid4(): ["A", "B"]})
+    response = await authorized_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 2
+
+
+@pytest.mark.anyio
+async def test_my_leaderboard_is_private(
+    authorized_client: AsyncClient, created_tournament: Tournament, db_session
+):
+    me = uuid.UUID(authorized_client.user_id)
+    await score_tournament(db_session, created_tournament, {me: ["A", "B"]})
+    url = f"/tournaments/{created_tournament.id}/leaderboard/me"
+
+    response = await authorized_client.get(url)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert response.headers["vary"] == "Authorization"
+
+    response = await authorized_client.get(
+        url, headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+    assert response.headers["vary"] == "Authorization"
@@ -0,0 +1,95 @@
+"""
+Tests for the number of SQL statements emitted per endpoint.
+"""
+
+import uuid
+import pytest
+from httpx import AsyncClient
+
+from pickemApi.models.model import Event, Team, Tournament, UserAnswer
+from pickemApi.services.response_cache import bump_tournament_version
+
+
+def data_statements(statements):
+    """Drop transaction control statements."""
+    return [
+        statement
+        for statement in statements
+        if statement.split()[0].upper() not in ("BEGIN", "COMMIT", "ROLLBACK")
+    ]
+
+
+async def add_answers(db_session, tournament: Tournament, event: Event, user_id):
+    tournament_teams = [Team(player_1=f"A{i}", player_2=f"B{i}") for i in range(3)]
+    db_session.add_all(tournament_teams)
+    await db_session.flush()
+    await db_session.refresh(tournament, ["teams"])
+    tournament.teams.extend(tournament_teams)
+    db_session.add(UserAnswer(user_id=user_id, event_id=event.id, answer="A"))
+    # Like the write endpoints, so reads do not need to look up the tournament
+    await bump_tournament_version(tournament.id, db_session)
+    await db_session.commit()
+
+
+@pytest.mark.anyio
+async def test_tournament_read_query_counts(
+    authorized_client: AsyncClient,
+    created_tournament: Tournament,
+    created_event: Event,
+    registered_user,
+    db_session,
+    count_queries,
+):
+    await add_answers(
+        db_session, created_tournament, created_event, uuid.UUID(registered_user.id)
+    )
+
+    with count_queries() as statements:
+        response = await authorized_client.get(
+            f"/tournaments/{created_tournament.id}/teams"
+        )
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    # Tournament version, tournament, its teams
+    assert len(data_statements(statements)) == 3
+
+    with count_queries() as statements:
+        response = await authorized_client.get(
+            f"/tournaments/{created_tournament.id}/teams"
+        )
+    assert len(response.json()) == 3
+    # Tournament version, the body is cached
+    assert len(data_statements(statements)) == 1
+
+    with count_queries() as statements:
+        response = await authorized_client.get(
+            f"/tournaments/{created_tournament.id}/events"
+        )
+    assert response.status_code == 200
+    assert "answers" not in response.json()[0]
+    # Tournament version, tournament, its events
+    assert len(data_statements(statements)) == 3
+
+
+@pytest.mark.anyio
+async def test_authenticated_query_counts(
+    authorized_client: AsyncClient, created_event: Event, count_queries
+):
+    with count_queries() as statements:
+        response = await authorized_client.get("/authenticated-route")
+    assert response.status_code == 200
+    # User
+    assert len(data_statements(statements)) == 1
+
+    with count_queries() as statements:
+        response = await authorized_client.post(
+            "/answers/",
+            json={
+                "user_id": str(authorized_client.user_id),
+                "event_id": str(created_event.id),
+                "answer": "Tak",
+            },
+        )
+    assert response.status_code == 201
+    # Answer upsert, the user is served from the auth cache
+    assert len(data_statements(statements)) == 1
@@ -0,0 +1,89 @@
+"""
+Tests for team management APIs.
+"""
+
+import json
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.future import select
+
+from pickemApi.models.model import Team
+from pickemApi.services import team_import
+
+
+async def stream(body: bytes, size: int = 7):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.mark.anyio
+async def test_import_teams_csv(authorized_superclient: AsyncClient, db_session):
+    body = "player_1,player_2\r\nAnna,Beata\r\n\r\nCelina\r\nDorota,Ewa".encode()
+
+    response = await authorized_superclient.post(
+        "/teams/import", content=stream(body), headers={"content-type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "imported": 2,
+        "failed": 1,
+        "errors": [{"line": 4, "detail": "player_2: Field required"}],
+    }
+    players = (await db_session.scalars(select(Team.player_1))).all()
+    assert sorted(players) == ["Anna", "Dorota"]
+
+
+@pytest.mark.anyio
+async def test_import_teams_csv_with_byte_order_mark(
+    authorized_superclient: AsyncClient, db_session
+):
+    body = "\ufeffplayer_1,player_2\r\nAnna,Beata".encode()
+
+    response = await authorized_superclient.post(
+        "/teams/import",
+        content=stream(body, size=2),
+        headers={"content-type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": 1, "failed": 0, "errors": []}
+    players = (await db_session.scalars(select(Team.player_1))).all()
+    assert players == ["Anna"]
+
+
+@pytest.mark.anyio
+async def test_import_teams_ndjson_in_chunks(
+    authorized_superclient: AsyncClient, db_session, monkeypatch
+):
+    monkeypatch.setattr(team_import, "IMPORT_CHUNK_ROWS", 2)
+    lines = [
+        json.dumps({"player_1": f"Player_{i}_1", "player_2": f"Player_{i}_2"})
+        for i in range(5)
+    ]
+    lines.insert(2, "[1, 2]")
+    body = "\n".join(lines).encode()
+
+    response = await authorized_superclient.post(
+        "/teams/import",
+        content=stream(body),
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "imported": 5,
+        "failed": 1,
+        "errors": [{"line": 3, "detail": "Line must be a JSON object."}],
+    }
+    players = (await db_session.scalars(select(Team.player_1))).all()
+    assert len(players) == 5
+
+
+@pytest.mark.anyio
+async def test_import_teams_rejects_unknown_format(authorized_superclient: AsyncClient):
+    response = await authorized_superclient.post(
+        "/teams/import", content=b"<teams/>", headers={"content-type": "text/xml"}
+    )
+
+    assert response.status_code == 415
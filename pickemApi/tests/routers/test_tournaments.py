@@ -6,6 +6,7 @@ import pytest
 import uuid
 from httpx import AsyncClient
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 
 from pickemApi.models.model import QuestionType, Team, Tournament, Event, UserAnswer
 
@@ -50,9 +51,11 @@ async def test_add_last_teams_to_tournament(
     assert response.json() == {"message": "Last 10 teams added to the tournament."}
 
     # Sprawdź, czy drużyny zostały dodane do turnieju
-    response_tournament = await db_session.get(Tournament, tournament_id)
+    response_tournament = await db_session.get(
+        Tournament, tournament_id, options=[selectinload(Tournament.teams)]
+    )
 
-    await db_session.refresh(created_tournament)
+    await db_session.refresh(created_tournament, ["teams"])
     assert response_tournament.teams == created_tournament.teams
     assert (
         len(response_tournament.teams) == 10
@@ -73,6 +76,37 @@ async def test_add_last_teams_to_tournament_no_teams(
     assert response.json() == {"detail": "No teams found in the database."}
 
 
+@pytest.mark.anyio
+async def test_add_teams_to_tournament_by_ids(
+    authorized_superclient: AsyncClient, created_tournament: Tournament, db_session
+):
+    teams = [Team(player_1=f"Player_{i}_1", player_2=f"Player_{i}_2") for i in range(3)]
+    db_session.add_all(teams)
+    await db_session.commit()
+    url = f"/tournaments/{created_tournament.id}/teams"
+
+    team_ids = [str(teams[0].id), str(teams[1].id), str(teams[0].id), str(uuid.uuid4())]
+    response = await authorized_superclient.post(url, json={"team_ids": team_ids})
+    assert response.status_code == 200
+    assert response.json() == {"added": 2}
+
+    team_ids = [str(team.id) for team in teams]
+    response = await authorized_superclient.post(url, json={"team_ids": team_ids})
+    assert response.json() == {"added": 1}
+
+    response = await authorized_superclient.get(url)
+    assert sorted(team["id"] for team in response.json()) == sorted(team_ids)
+
+
+@pytest.mark.anyio
+async def test_add_teams_to_missing_tournament(authorized_superclient: AsyncClient):
+    response = await authorized_superclient.post(
+        f"/tournaments/{uuid.uuid4()}/teams", json={"team_ids": []}
+    )
+
+    assert response.status_code == 404
+
+
 # Test dla endpointu create_sample_teams
 @pytest.mark.anyio
 async def test_create_sample_teams(authorized_superclient: AsyncClient, db_session):
@@ -396,3 +430,207 @@ async def test_finalize_tournament_no_answers(
     assert response.status_code == 200
     result = response.json()
     assert len(result["ranking"]) == 0  # No ranking as no answers are provided
+
+
+@pytest.mark.anyio
+async def test_create_events_bulk(authorized_superclient, created_tournament):
+    events = [
+        {
+            "question_type": "single_choice",
+            "question_text": f"Question {i}",
+            "points_value": i,
+        }
+        for i in range(3)
+    ]
+
+    response = await authorized_superclient.post(
+        f"/tournaments/{created_tournament.id}/events/bulk", json={"events": events}
+    )
+
+    assert response.status_code == 201
+    assert [event["question_text"] for event in response.json()] == [
+        "Question 0",
+        "Question 1",
+        "Question 2",
+    ]
+    response = await authorized_superclient.get(
+        f"/tournaments/{created_tournament.id}/events"
+    )
+    assert len(response.json()) == 3
+
+
+@pytest.mark.anyio
+async def test_create_events_bulk_invalid_points_value(
+    authorized_superclient, created_tournament
+):
+    events = [
+        {"question_type": "yes_no", "question_text": "Question", "points_value": 5},
+        {"question_type": "yes_no", "question_text": "Question", "points_value": -5},
+    ]
+
+    response = await authorized_superclient.post(
+        f"/tournaments/{created_tournament.id}/events/bulk", json={"events": events}
+    )
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Event 1: Points value must be non-negative"}
+
+
+@pytest.mark.anyio
+async def test_clone_events(authorized_superclient, created_event, db_session):
+    created_event.solution = "Team A"
+    target = Tournament(name="Puchar Polski")
+    db_session.add(target)
+    await db_session.commit()
+
+    response = await authorized_superclient.post(
+        f"/tournaments/{target.id}/events/clone",
+        params={"source_tournament_id": str(created_event.tournament_id)},
+    )
+
+    assert response.status_code == 201
+    [event] = response.json()
+    assert event["id"] != str(created_event.id)
+    assert event["tournament_id"] == str(target.id)
+    assert event["question_text"] == created_event.question_text
+    assert event["solution"] is None
+    stored = await db_session.get(Event, uuid.UUID(event["id"]))
+    assert stored.points_value == created_event.points_value
+
+
+@pytest.mark.anyio
+async def test_clone_events_source_not_found(
+    authorized_superclient, created_tournament
+):
+    response = await authorized_superclient.post(
+        f"/tournaments/{created_tournament.id}/events/clone",
+        params={"source_tournament_id": str(uuid.uuid4())},
+    )
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Source tournament not found"}
+
+
+@pytest.mark.anyio
+async def test_set_solutions_bulk(
+    authorized_superclient, created_tournament, db_session
+):
+    events = [
+        Event(
+            tournament_id=created_tournament.id,
+            question_type=question_type,
+            question_text="Question",
+            points_value=10,
+        )
+        for question_type in (QuestionType.YES_NO, QuestionType.SINGLE_CHOICE)
+    ]
+    db_session.add_all(events)
+    await db_session.flush()
+    user_id = uuid.uuid4()
+    db_session.add_all(
+        UserAnswer(user_id=user_id, event_id=event.id, answer=answer)
+        for event, answer in zip(events, ["yes", "Team B"])
+    )
+    await db_session.commit()
+    response = await authorized_superclient.get(
+        f"/tournaments/{created_tournament.id}/events"
+    )
+    assert [event["solution"] for event in response.json()] == [None, None]
+
+    response = await authorized_superclient.post(
+        f"/tournaments/{created_tournament.id}/solutions",
+        json={
+            "solutions": [
+                {"event_id": str(events[0].id), "solution": "yes"},
+                {"event_id": str(events[1].id), "solution": "Team A"},
+            ]
+        },
+    )
+
+    assert response.status_code == 201
+    assert [event["solution"] for event in response.json()] == ["yes", "Team A"]
+    answers = await db_session.execute(
+        select(UserAnswer.event_id, UserAnswer.points).execution_options(
+            populate_existing=True
+        )
+    )
+    assert dict(answers.all()) == {events[0].id: 10, events[1].id: 0}
+    response = await authorized_superclient.get(
+        f"/tournaments/{created_tournament.id}/events"
+    )
+    solutions = {event["id"]: event["solution"] for event in response.json()}
+    assert solutions == {str(events[0].id): "yes", str(events[1].id): "Team A"}
+
+
+@pytest.mark.anyio
+async def test_set_solutions_bulk_is_all_or_nothing(
+    authorized_superclient, created_event, db_session
+):
+    response = await authorized_superclient.post(
+        f"/tournaments/{created_event.tournament_id}/solutions",
+        json={
+            "solutions": [
+                {"event_id": str(created_event.id), "solution": "Team A"},
+                {"event_id": str(uuid.uuid4()), "solution": "Team A"},
+            ]
+        },
+    )
+
+    assert response.status_code == 404
+    await db_session.refresh(created_event)
+    assert created_event.solution is None
+
+
+@pytest.mark.anyio
+async def test_events_conditional_requests(authorized_superclient, created_tournament):
+    url = f"/tournaments/{created_tournament.id}/events"
+    response = await authorized_superclient.get(url)
+    assert response.json() == []
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, no-cache"
+
+    response = await authorized_superclient.get(
+        url, headers={"If-None-Match": f"W/{etag}"}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    events = [
+        {"question_type": "yes_no", "question_text": "Question", "points_value": 1}
+    ]
+    await authorized_superclient.post(f"{url}/bulk", json={"events": events})
+    response = await authorized_superclient.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 1
+
+
+@pytest.mark.anyio
+async def test_teams_conditional_requests(authorized_superclient, created_tournament):
+    url = f"/tournaments/{created_tournament.id}/teams"
+    response = await authorized_superclient.get(url)
+    etag = response.headers["etag"]
+
+    response = await authorized_superclient.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    await authorized_superclient.post("/teams/sample")
+    await authorized_superclient.post(
+        f"/tournaments/{created_tournament.id}/teams/add_last"
+    )
+    response = await authorized_superclient.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 10
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("route", ["teams", "events", "leaderboard"])
+async def test_conditional_request_for_unknown_tournament(authorized_client, route):
+    tournament_id = uuid.uuid4()
+    response = await authorized_client.get(
+        f"/tournaments/{tournament_id}/{route}",
+        headers={"If-None-Match": f'"{tournament_id}-0"'},
+    )
+    assert response.status_code == 404
@@ -6,7 +6,10 @@ import pytest
 import uuid
 import json
 from httpx import AsyncClient
-from pickemApi.models.model import QuestionType, Tournament, Event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.future import select
+from pickemApi.core.config import config
+from pickemApi.models.model import QuestionType, Tournament, Event, UserAnswer
 
 
 async def create_event(
@@ -132,3 +135,171 @@ async def test_submit_duplicate_answer(
 
     response_duplicate = await authorized_client.post("/answers/", json=answer_data)
     assert response_duplicate.status_code == 409
+
+
+@pytest.mark.anyio
+async def test_submit_answer_replace_mode(
+    authorized_client: AsyncClient, created_event: Event
+):
+    answer_data = {
+        "user_id": str(authorized_client.user_id),
+        "event_id": str(created_event.id),
+        "answer": "Tak",
+    }
+    response = await authorized_client.post("/answers/", json=answer_data)
+    assert response.status_code == 201
+
+    response_replace = await authorized_client.post(
+        "/answers/", json={**answer_data, "answer": "Nie"}, params={"mode": "replace"}
+    )
+    assert response_replace.status_code == 201
+    assert response_replace.json()["id"] == response.json()["id"]
+    assert response_replace.json()["answer"] == "Nie"
+
+
+@pytest.mark.anyio
+async def test_submit_answer_replace_rejected_after_solution(
+    authorized_client: AsyncClient, created_event: Event, db_session
+):
+    answer_data = {
+        "user_id": str(authorized_client.user_id),
+        "event_id": str(created_event.id),
+        "answer": "Tak",
+    }
+    response = await authorized_client.post("/answers/", json=answer_data)
+    assert response.status_code == 201
+    created_event.solution = "Tak"
+    await db_session.commit()
+
+    response_replace = await authorized_client.post(
+        "/answers/", json={**answer_data, "answer": "Nie"}, params={"mode": "replace"}
+    )
+    assert response_replace.status_code == 409
+    assert "solution" in response_replace.json()["detail"]
+    stored = await db_session.get(
+        UserAnswer, uuid.UUID(response.json()["id"]), populate_existing=True
+    )
+    assert stored.answer == "Tak"
+
+
+@pytest.mark.anyio
+async def test_duplicate_answer_rejected_by_database(
+    db_session, registered_user, created_event: Event
+):
+    db_session.add_all(
+        UserAnswer(
+            user_id=uuid.UUID(registered_user.id),
+            event_id=created_event.id,
+            answer=answer,
+        )
+        for answer in ("Tak", "Nie")
+    )
+    with pytest.raises(IntegrityError):
+        await db_session.commit()
+    await db_session.rollback()
+
+
+@pytest.mark.anyio
+async def test_submit_answers_batch(
+    authorized_client: AsyncClient, created_tournament: Tournament, db_session
+):
+    yes_no = await create_event(created_tournament, db_session, QuestionType.YES_NO)
+    single = await create_event(created_tournament, db_session)
+    multiple = await create_event(
+        created_tournament, db_session, QuestionType.MULTIPLE_CHOICE
+    )
+    answered = await create_event(created_tournament, db_session)
+    response = await authorized_client.post(
+        "/answers/",
+        json={
+            "user_id": str(authorized_client.user_id),
+            "event_id": str(answered.id),
+            "answer": "Polska",
+        },
+    )
+    assert response.status_code == 201
+
+    batch = {
+        "answers": [
+            {"event_id": str(yes_no.id), "answer": "Yes"},
+            {"event_id": str(single.id), "answer": ["USA", "Polska"]},
+            {"event_id": str(multiple.id), "answer": ["USA", "Polska"]},
+            {"event_id": str(answered.id), "answer": "USA"},
+            {"event_id": str(uuid.uuid4()), "answer": "USA"},
+            {"event_id": str(yes_no.id), "answer": "no"},
+        ]
+    }
+    response = await authorized_client.post(
+        f"/tournaments/{created_tournament.id}/answers/batch", json=batch
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["status_code"] for result in results] == [
+        201,
+        422,
+        201,
+        409,
+        404,
+        422,
+    ]
+    assert results[0]["answer"]["answer"] == "Yes"
+    assert json.loads(results[2]["answer"]["answer"]) == ["USA", "Polska"]
+    assert results[1]["answer"] is None
+
+    response = await authorized_client.post(
+        f"/tournaments/{created_tournament.id}/answers/batch",
+        json={"answers": [{"event_id": str(answered.id), "answer": "USA"}]},
+        params={"mode": "replace"},
+    )
+    assert response.json()[0]["status_code"] == 201
+    assert response.json()[0]["answer"]["answer"] == "USA"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("buffered", [False, True])
+async def test_answer_rejected_once_event_has_solution(
+    authorized_client: AsyncClient,
+    created_event: Event,
+    db_session,
+    monkeypatch,
+    buffered,
+):
+    monkeypatch.setattr(config, "ANSWER_BUFFER_ENABLED", buffered)
+    created_event.solution = "Tak"
+    await db_session.commit()
+
+    response = await authorized_client.post(
+        "/answers/",
+        json={
+            "user_id": authorized_client.user_id,
+            "event_id": str(created_event.id),
+            "answer": "Tak",
+        },
+    )
+    assert response.status_code == 409
+    assert "solution" in response.json()["detail"]
+
+    response = await authorized_client.post(
+        f"/tournaments/{created_event.tournament_id}/answers/batch",
+        json={"answers": [{"event_id": str(created_event.id), "answer": "Tak"}]},
+    )
+    assert [result["status_code"] for result in response.json()] == [409]
+
+    answers = await db_session.scalars(
+        select(UserAnswer).where(UserAnswer.event_id == created_event.id)
+    )
+    assert answers.all() == []
+
+
+@pytest.mark.anyio
+async def test_answer_for_unknown_event(authorized_client: AsyncClient):
+    response = await authorized_client.post(
+        "/answers/",
+        json={
+            "user_id": authorized_client.user_id,
+            "event_id": str(uuid.uuid4()),
+            "answer": "Tak",
+        },
+    )
+    assert response.status_code == 404
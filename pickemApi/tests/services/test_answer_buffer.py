@@ -0,0 +1,109 @@
+"""
+Tests for buffered answer submissions.
+"""
+
+import asyncio
+import uuid
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from pickemApi.core.config import config
+from pickemApi.core.database import async_session_maker
+from pickemApi.models.enums import AnswerConflictMode
+from pickemApi.models.model import Event, UserAnswer
+from pickemApi.services.answer_buffer import AnswerWriteBuffer
+
+
+@pytest.mark.anyio
+async def test_buffer_groups_submissions_and_rejects_duplicates(
+    created_event: Event, db_session
+):
+    buffer = AnswerWriteBuffer(async_session_maker, flush_interval=0.05, max_rows=50)
+    users = [uuid.uuid4() for _ in range(20)]
+
+    def row(user_id, answer):
+        return {"user_id": user_id, "event_id": created_event.id, "answer": answer}
+
+    results = await asyncio.gather(
+        *(buffer.submit(row(user_id, "A"), AnswerConflictMode.REJECT) for user_id in users),
+        buffer.submit(row(users[0], "B"), AnswerConflictMode.REJECT),
+        buffer.submit(row(users[1], "C"), AnswerConflictMode.REPLACE),
+    )
+    await buffer.close()
+
+    assert all(answer is not None for answer in results[:20])
+    assert results[20] is None
+    assert results[21].id == results[1].id
+    assert results[21].answer == "C"
+
+    count = await db_session.scalar(
+        select(func.count()).where(UserAnswer.event_id == created_event.id)
+    )
+    assert count == 20
+
+
+@pytest.mark.anyio
+async def test_submit_answer_buffered(
+    authorized_client: AsyncClient, created_event: Event, monkeypatch
+):
+    monkeypatch.setattr(config, "ANSWER_BUFFER_ENABLED", True)
+    answer_data = {
+        "user_id": str(authorized_client.user_id),
+        "event_id": str(created_event.id),
+        "answer": "Tak",
+    }
+
+    response = await authorized_client.post("/answers/", json=answer_data)
+    assert response.status_code == 201
+    assert response.json()["answer"] == "Tak"
+
+    response_duplicate = await authorized_client.post("/answers/", json=answer_data)
+    assert response_duplicate.status_code == 409
+
+
+@pytest.mark.anyio
+async def test_buffer_failing_row_fails_alone(created_event: Event, db_session):
+    buffer = AnswerWriteBuffer(async_session_maker, flush_interval=0.05, max_rows=50)
+    users = [uuid.uuid4() for _ in range(3)]
+    rows = [
+        {"user_id": user_id, "event_id": created_event.id, "answer": answer}
+        for user_id, answer in zip(users, ["A", None, "B"])
+    ]
+
+    results = await asyncio.gather(
+        *(buffer.submit(row, AnswerConflictMode.REJECT) for row in rows),
+        return_exceptions=True,
+    )
+    await buffer.close()
+
+    assert results[0].answer == "A"
+    assert results[1].status_code == 400
+    assert results[2].answer == "B"
+
+
+@pytest.mark.anyio
+async def test_buffer_close_resolves_submissions_in_flight(
+    created_event: Event, db_session
+):
+    buffer = AnswerWriteBuffer(async_session_maker, flush_interval=0.05, max_rows=50)
+    submissions = [
+        asyncio.create_task(
+            buffer.submit(
+                {"user_id": uuid.uuid4(), "event_id": created_event.id, "answer": "A"},
+                AnswerConflictMode.REJECT,
+            )
+        )
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0.01)
+
+    await buffer.close()
+    results = await asyncio.wait_for(asyncio.gather(*submissions), timeout=5)
+
+    assert all(answer is not None for answer in results)
+    count = await db_session.scalar(
+        select(func.count()).where(UserAnswer.event_id == created_event.id)
+    )
+    assert count == 5
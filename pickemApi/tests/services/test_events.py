@@ -3,7 +3,7 @@ Tests for event services.
 """
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 from pickemApi.services.event_solution_service import set_event_solution_service
 from pickemApi.models.model import Event, QuestionType
@@ -16,6 +16,7 @@ async def test_set_solution_success():
     mock_event = Event(id=uuid4(), question_type=QuestionType.YES_NO)
     mock_db = AsyncMock()
     mock_db.get.return_value = mock_event
+    mock_db.execute.return_value = MagicMock(**{"all.return_value": []})
 
     solution_data = EventSolutionCreate(solution="yes")
     result = await set_event_solution_service(
@@ -23,7 +24,8 @@ async def test_set_solution_success():
     )
     print(result)
     assert result.solution == solution_data.solution
-    mock_db.commit.assert_called_once()
+    mock_db.flush.assert_called_once()
+    mock_db.commit.assert_not_called()
 
 
 @pytest.mark.anyio
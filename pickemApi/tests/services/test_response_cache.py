@@ -0,0 +1,38 @@
+"""
+Tests for the cache of serialized tournament responses.
+"""
+
+import pytest
+
+from pickemApi.models.model import Tournament
+from pickemApi.services.response_cache import (
+    ResponseCache,
+    bump_tournament_version,
+    get_tournament_version,
+)
+
+
+@pytest.mark.anyio
+async def test_response_cache_is_bounded_by_bytes():
+    cache = ResponseCache(max_bytes=10)
+
+    cache.set("first", 1, b"12345")
+    cache.set("second", 1, b"12345")
+    assert cache.get("first", 1) == b"12345"
+    cache.set("third", 1, b"123")
+    assert cache.get("second", 1) is None
+    assert cache.size == 8
+
+    cache.set("huge", 1, b"12345678901")
+    assert cache.get("huge", 1) is None
+    assert cache.get("first", 2) is None
+
+
+@pytest.mark.anyio
+async def test_bump_tournament_version(db_session, created_tournament: Tournament):
+    assert await get_tournament_version(created_tournament.id, db_session) == 0
+
+    await bump_tournament_version(created_tournament.id, db_session)
+    await bump_tournament_version(created_tournament.id, db_session)
+
+    assert await get_tournament_version(created_tournament.id, db_session) == 2
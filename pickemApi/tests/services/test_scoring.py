@@ -0,0 +1,99 @@
+"""
+Tests for incremental scoring of event solutions.
+"""
+
+import uuid
+import pytest
+from sqlalchemy.future import select
+
+from pickemApi.models.model import Event, QuestionType, User, UserAnswer
+from pickemApi.schemas.events import EventSolutionCreate
+from pickemApi.services.event_solution_service import set_event_solution_service
+
+
+async def create_scoring_fixture(db_session):
+    """Create two events with answers from two users."""
+    tournament_id = uuid.uuid4()
+    winner = Event(
+        tournament_id=tournament_id,
+        question_type=QuestionType.SINGLE_CHOICE,
+        question_text="Who wins?",
+        points_value=20,
+    )
+    sunny = Event(
+        tournament_id=tournament_id,
+        question_type=QuestionType.YES_NO,
+        question_text="Is it sunny?",
+        points_value=10,
+    )
+    users = [
+        User(email=f"{name}@example.com", hashed_password="hash", username=name)
+        for name in ("first", "second")
+    ]
+    db_session.add_all([winner, sunny, *users])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            UserAnswer(user_id=users[0].id, event_id=winner.id, answer="Team A"),
+            UserAnswer(user_id=users[1].id, event_id=winner.id, answer="Team B"),
+            UserAnswer(user_id=users[0].id, event_id=sunny.id, answer="yes"),
+            UserAnswer(user_id=users[1].id, event_id=sunny.id, answer="yes"),
+        ]
+    )
+    await db_session.commit()
+    return winner, sunny, users
+
+
+async def user_points(db_session, users):
+    result = await db_session.execute(
+        select(User.id, User.points).where(User.id.in_([user.id for user in users]))
+    )
+    points = dict(result.all())
+    return [points[user.id] for user in users]
+
+
+async def answer_points(db_session, event):
+    result = await db_session.execute(
+        select(UserAnswer.user_id, UserAnswer.points).where(
+            UserAnswer.event_id == event.id
+        )
+    )
+    return dict(result.all())
+
+
+@pytest.mark.anyio
+async def test_setting_solution_scores_only_that_event(db_session):
+    winner, sunny, users = await create_scoring_fixture(db_session)
+
+    await set_event_solution_service(
+        winner.id, EventSolutionCreate(solution="Team A"), db_session
+    )
+
+    assert await user_points(db_session, users) == [20, 0]
+    assert await answer_points(db_session, winner) == {users[0].id: 20, users[1].id: 0}
+    assert await answer_points(db_session, sunny) == {users[0].id: 0, users[1].id: 0}
+
+
+@pytest.mark.anyio
+async def test_correcting_solution_applies_point_differences(db_session):
+    winner, sunny, users = await create_scoring_fixture(db_session)
+
+    await set_event_solution_service(
+        sunny.id, EventSolutionCreate(solution="yes"), db_session
+    )
+    await set_event_solution_service(
+        winner.id, EventSolutionCreate(solution="Team A"), db_session
+    )
+    assert await user_points(db_session, users) == [30, 10]
+
+    await set_event_solution_service(
+        winner.id, EventSolutionCreate(solution="Team B"), db_session
+    )
+    assert await user_points(db_session, users) == [10, 30]
+    assert await answer_points(db_session, winner) == {users[0].id: 0, users[1].id: 20}
+
+    await set_event_solution_service(
+        winner.id, EventSolutionCreate(solution="Team B"), db_session
+    )
+    assert await user_points(db_session, users) == [10, 30]
@@ -0,0 +1,165 @@
+"""
+Tests for global season standings.
+"""
+
+import random
+import uuid
+import pytest
+from httpx import AsyncClient
+
+from pickemApi.models.model import Event, QuestionType, User, UserAnswer
+from pickemApi.schemas.events import EventSolutionCreate
+from pickemApi.services.event_solution_service import set_event_solution_service
+from pickemApi.services.standings import GlobalStandings, RankTree, global_standings
+
+
+@pytest.mark.anyio
+async def test_rank_tree_matches_sorted_list():
+    rng = random.Random(11)
+    tree, keys = RankTree(), []
+    for _ in range(2000):
+        if keys and rng.random() < 0.4:
+            key = keys.pop(rng.randrange(len(keys)))
+            tree.remove(key)
+        else:
+            key = (-rng.randint(0, 50), uuid.uuid4().hex)
+            keys.append(key)
+            tree.insert(key)
+
+    keys.sort()
+    assert len(tree) == len(keys)
+    assert [tree.select(i) for i in range(len(keys))] == keys
+    for points in range(0, 52, 5):
+        probe = (-points, "")
+        assert tree.count_lower(probe) == sum(key < probe for key in keys)
+
+
+async def create_players(db_session, count: int):
+    users = [
+        User(
+            email=f"{uuid.uuid4().hex}@example.com",
+            hashed_password="hash",
+            username=uuid.uuid4().hex,
+        )
+        for _ in range(count)
+    ]
+    event = Event(
+        tournament_id=uuid.uuid4(),
+        question_type=QuestionType.SINGLE_CHOICE,
+        question_text="Who wins?",
+        points_value=10,
+    )
+    db_session.add_all([*users, event])
+    await db_session.flush()
+    return users, event
+
+
+@pytest.mark.anyio
+async def test_workers_see_point_changes(db_session):
+    users, event = await create_players(db_session, 3)
+    db_session.add_all(
+        UserAnswer(user_id=user.id, event_id=event.id, answer=answer)
+        for user, answer in zip(users, ["A", "B", "A"])
+    )
+    await db_session.commit()
+
+    first_worker, second_worker = GlobalStandings(), GlobalStandings()
+    await first_worker.load(db_session)
+    await second_worker.load(db_session)
+    assert await second_worker.page(1, 10, db_session) == []
+
+    await set_event_solution_service(
+        event.id, EventSolutionCreate(solution="A"), db_session
+    )
+    page = await second_worker.page(1, 10, db_session)
+    assert sorted(entry["user_id"] for entry in page) == sorted(
+        [users[0].id, users[2].id]
+    )
+    assert [(entry["points"], entry["rank"]) for entry in page] == [(10, 1), (10, 1)]
+    assert await second_worker.rank_of(users[1].id, db_session) == {
+        "user_id": users[1].id,
+        "points": 0,
+        "rank": 2,
+    }
+
+    await set_event_solution_service(
+        event.id, EventSolutionCreate(solution="B"), db_session
+    )
+    assert await first_worker.page(1, 10, db_session) == [
+        {"user_id": users[1].id, "points": 10, "rank": 1}
+    ]
+    assert (await first_worker.rank_of(users[0].id, db_session))["rank"] == 2
+
+
+@pytest.mark.anyio
+async def test_standings_endpoints(authorized_client: AsyncClient, db_session):
+    users, event = await create_players(db_session, 2)
+    me = uuid.UUID(authorized_client.user_id)
+    db_session.add_all(
+        UserAnswer(user_id=user_id, event_id=event.id, answer="A")
+        for user_id in [users[0].id, me]
+    )
+    await db_session.commit()
+    await global_standings.load(db_session)
+    await set_event_solution_service(
+        event.id, EventSolutionCreate(solution="A"), db_session
+    )
+    await db_session.commit()
+
+    response = await authorized_client.get("/standings/me")
+    assert response.status_code == 200
+    assert response.json() == {"user_id": str(me), "points": 10, "rank": 1}
+
+    response = await authorized_client.get(
+        "/standings", params={"start_rank": 1, "limit": 5}
+    )
+    assert response.status_code == 200
+    assert [entry["rank"] for entry in response.json()] == [1, 1]
+
+    response = await authorized_client.get("/standings", params={"start_rank": 2})
+    assert response.json() == []
+
+
+@pytest.mark.anyio
+async def test_sync_skips_versions_of_lagging_replicas(db_session, monkeypatch):
+    users, event = await create_players(db_session, 2)
+    db_session.add(UserAnswer(user_id=users[0].id, event_id=event.id, answer="A"))
+    await db_session.commit()
+    await set_event_solution_service(
+        event.id, EventSolutionCreate(solution="A"), db_session
+    )
+    await db_session.commit()
+    worker = GlobalStandings()
+    await worker.load(db_session)
+
+    async def lagging_version(db):
+        return 0
+
+    async def fail_load(db, version):
+        raise AssertionError("standings reloaded")
+
+    monkeypatch.setattr(
+        "pickemApi.services.standings.get_standings_version", lagging_version
+    )
+    monkeypatch.setattr(worker, "_load", fail_load)
+    assert await worker.page(1, 10, db_session) == [
+        {"user_id": users[0].id, "points": 10, "rank": 1}
+    ]
+
+
+@pytest.mark.anyio
+async def test_page_starts_at_dense_rank(db_session):
+    users, _ = await create_players(db_session, 3)
+    for user, points in zip(users, [10, 10, 5]):
+        user.points = points
+    await db_session.commit()
+    worker = GlobalStandings()
+    await worker.load(db_session)
+
+    page = await worker.page(2, 10, db_session)
+    assert page == [{"user_id": users[2].id, "points": 5, "rank": 2}]
+    page = await worker.page(1, 2, db_session)
+    assert sorted(entry["user_id"] for entry in page) == sorted(
+        [users[0].id, users[1].id]
+    )
+    assert await worker.page(3, 10, db_session) == []
@@ -0,0 +1,118 @@
+"""
+Tests for tournament services.
+"""
+
+import json
+import uuid
+import pytest
+from sqlalchemy.future import select
+
+from pickemApi.models.enums import FinalizeMode
+from pickemApi.models.model import Event, QuestionType, User, UserAnswer
+from pickemApi.services.tournament import finalize_tournament
+
+
+EVENTS = [
+    (QuestionType.YES_NO, "yes", 10),
+    (QuestionType.SINGLE_CHOICE, "Team A", 20),
+    (QuestionType.MULTIPLE_CHOICE, json.dumps(["Team A", "Team B"]), 15),
+    (QuestionType.SINGLE_CHOICE, "Team C", 0),
+]
+
+ANSWERS = [
+    ["YES", "Team A", json.dumps(["Team B", "Team A"]), "Team C"],
+    ["no", "Team A", json.dumps(["Team A", "Team B"]), "Team B"],
+    ["yes", "team a", json.dumps(["Team A"]), "Team C"],
+    ["no", "Team B", json.dumps(["Team C"]), "Team A"],
+]
+
+
+async def create_finalize_fixture(db_session):
+    """Create a tournament with one answer per user per event."""
+    tournament_id = uuid.uuid4()
+    events = [
+        Event(
+            tournament_id=tournament_id,
+            question_type=question_type,
+            question_text=f"Question {i}",
+            solution=solution,
+            points_value=points_value,
+        )
+        for i, (question_type, solution, points_value) in enumerate(EVENTS)
+    ]
+    users = [
+        User(
+            email=f"{uuid.uuid4().hex}@example.com",
+            hashed_password="hash",
+            username=uuid.uuid4().hex,
+            points=5,
+        )
+        for _ in ANSWERS
+    ]
+    db_session.add_all(events + users)
+    await db_session.flush()
+
+    db_session.add_all(
+        UserAnswer(user_id=user.id, event_id=event.id, answer=answer)
+        for user, user_answers in zip(users, ANSWERS)
+        for event, answer in zip(events, user_answers)
+    )
+    await db_session.commit()
+    return tournament_id, events, users
+
+
+async def collect_points(db_session, events, users):
+    answer_points = await db_session.execute(
+        select(UserAnswer.user_id, UserAnswer.event_id, UserAnswer.points)
+        .where(UserAnswer.event_id.in_([event.id for event in events]))
+        .execution_options(populate_existing=True)
+    )
+    user_points = await db_session.execute(
+        select(User.id, User.points).where(User.id.in_([user.id for user in users]))
+    )
+    event_index = {event.id: i for i, event in enumerate(events)}
+    user_index = {user.id: i for i, user in enumerate(users)}
+    return (
+        sorted(
+            (user_index[user_id], event_index[event_id], points)
+            for user_id, event_id, points in answer_points
+        ),
+        sorted((user_index[user_id], points) for user_id, points in user_points),
+    )
+
+
+@pytest.mark.anyio
+async def test_finalize_sql_mode_matches_python_mode(db_session):
+    python_id, python_events, python_users = await create_finalize_fixture(db_session)
+    sql_id, sql_events, sql_users = await create_finalize_fixture(db_session)
+
+    python_result = await finalize_tournament(python_id, db_session, FinalizeMode.PYTHON)
+    sql_result = await finalize_tournament(sql_id, db_session, FinalizeMode.SQL)
+
+    assert await collect_points(
+        db_session, python_events, python_users
+    ) == await collect_points(db_session, sql_events, sql_users)
+
+    def by_user(result, users):
+        user_index = {user.id: i for i, user in enumerate(users)}
+        return sorted(
+            (user_index[entry["user_id"]], entry["points"])
+            for entry in result["ranking"].values()
+        )
+
+    assert by_user(python_result, python_users) == by_user(sql_result, sql_users)
+    assert len(sql_result["ranking"]) == 3
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("mode", [FinalizeMode.PYTHON, FinalizeMode.SQL])
+async def test_finalize_twice_is_idempotent(db_session, mode):
+    tournament_id, events, users = await create_finalize_fixture(db_session)
+
+    first_result = await finalize_tournament(tournament_id, db_session, mode)
+    first_points = await collect_points(db_session, events, users)
+    second_result = await finalize_tournament(tournament_id, db_session, mode)
+
+    assert await collect_points(db_session, events, users) == first_points
+    assert second_result == first_result
+    assert first_points[1] == [(0, 50), (1, 40), (2, 15), (3, 5)]
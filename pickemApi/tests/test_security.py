@@ -2,9 +2,19 @@
 Tests for security features API.
 """
 
+import asyncio
+import threading
+import uuid
 import pytest
 
+from fastapi import HTTPException
+from fastapi_users.schemas import BaseUserUpdate
 from httpx import AsyncClient
+from pickemApi.core.database import AuthUserDatabase
+from pickemApi.core.password import PasswordHashingPool
+from pickemApi.core.security import TokenRevocations, claims_jwt_strategy
+from pickemApi.main import app
+from pickemApi.models.usermanager import current_admin_from_claims, current_admin_user
 from pickemApi.models.model import User
 from pickemApi.models.usermanager import UserManager
 
@@ -69,3 +79,87 @@ async def test_endpoint_with_authentication(authorized_client: AsyncClient):
     assert res.status_code == 200
 
     assert "message" in res.json()
+
+
+@pytest.mark.anyio
+async def test_password_pool_fails_fast_when_saturated():
+    release = threading.Event()
+    pool = PasswordHashingPool(workers=1, max_pending=1)
+
+    blocked = asyncio.create_task(pool.run(release.wait))
+    await asyncio.sleep(0.01)
+    with pytest.raises(HTTPException) as error:
+        await pool.run(len, "password")
+    assert error.value.status_code == 503
+
+    release.set()
+    await blocked
+    assert await pool.run(len, "password") == 8
+
+
+@pytest.fixture
+def claims_admin_routes():
+    app.dependency_overrides[current_admin_user] = current_admin_from_claims
+    yield
+    app.dependency_overrides.pop(current_admin_user)
+
+
+@pytest.mark.anyio
+async def test_admin_authorized_from_claims(
+    async_client: AsyncClient,
+    superuser: User,
+    db_session,
+    claims_admin_routes,
+    count_queries,
+):
+    token = await claims_jwt_strategy.write_token(superuser)
+    headers = {"Authorization": f"Bearer {token}"}
+    tournament_data = {"name": "Puchar Świata", "date": "2024-10-24"}
+
+    with count_queries() as statements:
+        response = await async_client.post(
+            "/tournaments/", json=tournament_data, headers=headers
+        )
+    assert response.status_code == 201
+    assert not any("FROM users" in statement for statement in statements)
+
+    user_manager = UserManager(AuthUserDatabase(db_session, User))
+    user = await user_manager.get(superuser.id)
+    await user_manager.update(BaseUserUpdate(is_active=False), user, safe=False)
+
+    response = await async_client.post(
+        "/tournaments/", json=tournament_data, headers=headers
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_claims_of_regular_user_are_forbidden(
+    async_client: AsyncClient, registered_user: User, claims_admin_routes
+):
+    registered_user.is_active = True
+    registered_user.is_superuser = False
+    token = await claims_jwt_strategy.write_token(registered_user)
+
+    response = await async_client.post(
+        "/tournaments/",
+        json={"name": "Puchar Świata", "date": "2024-10-24"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_token_revocations_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("pickemApi.core.security.time.time", lambda: now[0])
+    revocations = TokenRevocations(lifetime_seconds=60)
+    user_id = uuid.uuid4()
+
+    revocations.revoke(user_id)
+    assert revocations.is_revoked(str(user_id), issued_at=999)
+    assert not revocations.is_revoked(str(user_id), issued_at=1001)
+
+    now[0] += 61
+    assert not revocations.is_revoked(str(user_id), issued_at=999)
+    assert revocations._revoked == {}
@@ -0,0 +1,52 @@
+"""
+Tests for the cache of authenticated users.
+"""
+
+import uuid
+import pytest
+from fastapi_users.schemas import BaseUserUpdate
+from httpx import AsyncClient
+
+from pickemApi.core.database import AuthUserDatabase
+from pickemApi.core.user_cache import UserCache, user_cache
+from pickemApi.models.model import User
+from pickemApi.models.usermanager import UserManager
+
+
+@pytest.mark.anyio
+async def test_user_cache_lru_and_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("pickemApi.core.user_cache.time.monotonic", lambda: now[0])
+    cache = UserCache(max_entries=2, ttl_seconds=10)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    cache.set(first, {"email": "first"})
+    cache.set(second, {"email": "second"})
+    assert cache.get(first) == {"email": "first"}
+    cache.set(third, {"email": "third"})
+    assert cache.get(second) is None
+
+    now[0] += 11
+    assert cache.get(first) is None
+
+
+@pytest.mark.anyio
+async def test_deactivated_user_is_not_served_from_cache(
+    authorized_client: AsyncClient, db_session, count_queries
+):
+    user_id = uuid.UUID(authorized_client.user_id)
+    hits = user_cache.hits
+
+    assert (await authorized_client.get("/authenticated-route")).status_code == 200
+    with count_queries() as statements:
+        response = await authorized_client.get("/authenticated-route")
+    assert response.status_code == 200
+    assert statements == []
+    assert user_cache.hits == hits + 1
+
+    user_manager = UserManager(AuthUserDatabase(db_session, User))
+    user = await user_manager.get(user_id)
+    await user_manager.update(BaseUserUpdate(is_active=False), user, safe=False)
+
+    response = await authorized_client.get("/authenticated-route")
+    assert response.status_code == 401
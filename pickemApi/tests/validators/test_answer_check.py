@@ -0,0 +1,82 @@
+"""
+Tests for answer checking.
+"""
+
+import json
+import random
+import pytest
+import numpy as np
+
+from pickemApi.models.enums import QuestionType
+from pickemApi.validators.answer_check import AnswerCodes, check_answer, score_answers
+
+
+EVENTS = [
+    (QuestionType.YES_NO, "yes", 10),
+    (QuestionType.YES_NO, "No", 5),
+    (QuestionType.SINGLE_CHOICE, "Team A", 20),
+    (QuestionType.MULTIPLE_CHOICE, ["Team A", "Team B"], 15),
+    (QuestionType.MULTIPLE_CHOICE, "Team A", 15),
+    (QuestionType.MULTIPLE_CHOICE, json.dumps(["Team A", "Team B"]), 15),
+    (QuestionType.SINGLE_CHOICE, None, 30),
+]
+
+CHOICES = {
+    QuestionType.YES_NO: ["yes", "YES", "no", "No"],
+    QuestionType.SINGLE_CHOICE: ["Team A", "team a", "Team B"],
+    QuestionType.MULTIPLE_CHOICE: [
+        ["Team B", "Team A"],
+        ["Team A"],
+        "Team A",
+        ["Team A", "Team B", "Team C"],
+        json.dumps(["Team B", "Team A"]),
+        json.dumps(["Team A"]),
+        "not json",
+    ],
+}
+
+
+@pytest.mark.anyio
+async def test_score_answers_matches_check_answer():
+    rng = random.Random(7)
+    user_count = 20
+    rows = [
+        (event_i, user_i, rng.choice(CHOICES[EVENTS[event_i][0]]))
+        for event_i in range(len(EVENTS))
+        for user_i in range(user_count)
+        if rng.random() < 0.8
+    ]
+
+    codes = AnswerCodes()
+    correct, points, user_points = score_answers(
+        np.array([event_i for event_i, _, _ in rows]),
+        np.array([user_i for _, user_i, _ in rows]),
+        np.array([codes.encode(answer, EVENTS[i][0]) for i, _, answer in rows]),
+        np.array([codes.encode(solution, qt) for qt, solution, _ in EVENTS]),
+        np.array([points_value for _, _, points_value in EVENTS]),
+        user_count,
+    )
+
+    expected_points = [0] * user_count
+    for row, (event_i, user_i, answer) in enumerate(rows):
+        question_type, solution, points_value = EVENTS[event_i]
+        expected = solution is not None and check_answer(
+            answer, solution, question_type
+        )
+        assert correct[row] == expected
+        assert points[row] == (points_value if expected else 0)
+        expected_points[user_i] += points[row]
+
+    assert user_points.tolist() == expected_points
+
+
+@pytest.mark.anyio
+async def test_multiple_choice_matches_stored_json():
+    answer, solution = json.dumps(["a", "b"]), json.dumps(["b", "a"])
+    codes = AnswerCodes()
+
+    assert check_answer(answer, solution, QuestionType.MULTIPLE_CHOICE)
+    assert codes.encode(answer, QuestionType.MULTIPLE_CHOICE) == codes.encode(
+        solution, QuestionType.MULTIPLE_CHOICE
+    )
+    assert not check_answer(answer, json.dumps(["a"]), QuestionType.MULTIPLE_CHOICE)
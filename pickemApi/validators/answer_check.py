@@ -2,8 +2,27 @@
 Logic for checking answers with solutions.
 """
 
+import json
+import numpy as np
+
 from pickemApi.models.enums import QuestionType
-from typing import Union, List
+from typing import Union, List, Optional
+
+
+def decode_choices(value: Union[str, List[str], None]) -> Optional[List[str]]:
+    """Return a multiple choice value as a list, decoding stored JSON text.
+
+    Answers and solutions are stored as JSON text, so both the stored and the
+    decoded form are accepted. Anything that is not a list of strings is None.
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return None
+    if isinstance(value, list) and all(isinstance(choice, str) for choice in value):
+        return value
+    return None
 
 
 def check_answer(
@@ -19,6 +38,70 @@ def check_answer(
             answer == solution
         )  # or implement custom comparison logic for objects in the future
     elif question_type == QuestionType.MULTIPLE_CHOICE:
-        if isinstance(answer, list) and isinstance(solution, list):
+        answer, solution = decode_choices(answer), decode_choices(solution)
+        if answer is not None and solution is not None:
             return sorted(answer) == sorted(solution)  # Order doesn't matter
     return False
+
+
+NO_MATCH = -1
+
+
+class AnswerCodes:
+    """Encode answers and solutions as integers comparable like `check_answer`.
+
+    Two values get the same code exactly when `check_answer` would consider
+    them equal for the given question type. `NO_MATCH` never matches anything.
+    """
+
+    def __init__(self):
+        self._codes = {}
+        self._cache = {}
+
+    def encode(
+        self, value: Optional[Union[str, List[str]]], question_type: QuestionType
+    ) -> int:
+        if isinstance(value, str):
+            cache_key = (question_type, value)
+            code = self._cache.get(cache_key)
+            if code is None:
+                code = self._cache[cache_key] = self._code(value, question_type)
+            return code
+        return self._code(value, question_type)
+
+    def _code(self, value, question_type: QuestionType) -> int:
+        if value is None:
+            return NO_MATCH
+        if question_type == QuestionType.YES_NO:
+            key = value.lower()
+        elif question_type == QuestionType.SINGLE_CHOICE:
+            key = tuple(value) if isinstance(value, list) else value
+        elif question_type == QuestionType.MULTIPLE_CHOICE:
+            choices = decode_choices(value)
+            if choices is None:
+                return NO_MATCH
+            key = ("multiple", *sorted(choices))
+        else:
+            return NO_MATCH
+        return self._codes.setdefault(key, len(self._codes))
+
+
+def score_answers(
+    event_index: np.ndarray,
+    user_index: np.ndarray,
+    answer_code: np.ndarray,
+    solution_code: np.ndarray,
+    points_value: np.ndarray,
+    user_count: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Score every answer of a tournament in one vectorized pass.
+
+    `event_index`, `user_index` and `answer_code` hold one row per answer,
+    `solution_code` and `points_value` one row per event. Returns the
+    correctness and points of each answer and the points of each user.
+    """
+    row_solution = solution_code[event_index]
+    correct = (answer_code == row_solution) & (row_solution != NO_MATCH)
+    points = np.where(correct, points_value[event_index], 0)
+    user_points = np.bincount(user_index, weights=points, minlength=user_count)
+    return correct, points, user_points.astype(np.int64)
@@ -27,3 +27,25 @@ def validate_event_solution_type(solution, question_type):
             )
 
     return solution
+
+
+def validate_answer_type(answer, question_type):
+    if question_type == QuestionType.YES_NO and (
+        not isinstance(answer, str) or answer.lower() not in ["yes", "no"]
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail="Answer must be 'yes' or 'no' for YES_NO questions.",
+        )
+    if question_type == QuestionType.SINGLE_CHOICE and not isinstance(answer, str):
+        raise HTTPException(
+            status_code=422,
+            detail="Answer must be a single string for SINGLE_CHOICE questions.",
+        )
+    if question_type == QuestionType.MULTIPLE_CHOICE and not isinstance(answer, list):
+        raise HTTPException(
+            status_code=422,
+            detail="Answer must be a list of strings for MULTIPLE_CHOICE questions.",
+        )
+
+    return answer